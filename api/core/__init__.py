@@ -4,11 +4,13 @@ Core API components for STL Analysis.
 
 from .models import *
 from .session_manager import SessionManager
-from .stl_tools import STLTools
+from .stl_tools import STLTools, PlatingContext, PlatingResult
 
 __all__ = [
     "SessionManager",
     "STLTools",
+    "PlatingContext",
+    "PlatingResult",
     "APIResponse",
     "FileUploadResponse", 
     "SessionInfo",
@@ -0,0 +1,106 @@
+"""
+Fused per-triangle mesh analysis kernel.
+
+Computes triangle areas, signed volume and the vertex sum in a single pass
+over the mesh coordinates. Uses numba when it is installed and falls back to
+an equivalent NumPy implementation otherwise.
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def _mesh_stats_numpy(vx: np.ndarray, vy: np.ndarray, vz: np.ndarray) -> Tuple[np.ndarray, float, np.ndarray]:
+    """NumPy implementation of mesh_stats."""
+    x0, x1, x2 = vx.astype(np.float64)
+    y0, y1, y2 = vy.astype(np.float64)
+    z0, z1, z2 = vz.astype(np.float64)
+
+    # Area from the cross product of two edges
+    e1x, e1y, e1z = x1 - x0, y1 - y0, z1 - z0
+    e2x, e2y, e2z = x2 - x0, y2 - y0, z2 - z0
+    nx = e1y * e2z - e1z * e2y
+    ny = e1z * e2x - e1x * e2z
+    nz = e1x * e2y - e1y * e2x
+    areas = 0.5 * np.sqrt(nx * nx + ny * ny + nz * nz)
+
+    # Signed volume of the tetrahedron with the origin: a . (b x c) / 6
+    signed_volume = float(np.sum(x0 * (y1 * z2 - z1 * y2) + y0 * (z1 * x2 - x1 * z2) + z0 * (x1 * y2 - y1 * x2))) / 6.0
+
+    vertex_sum = np.array([vx.sum(dtype=np.float64), vy.sum(dtype=np.float64), vz.sum(dtype=np.float64)])
+    return areas, signed_volume, vertex_sum
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _mesh_stats_numba(vx, vy, vz):
+        """Numba implementation of mesh_stats."""
+        n = vx.shape[1]
+        areas = np.empty(n, dtype=np.float64)
+        volume = 0.0
+        sx = 0.0
+        sy = 0.0
+        sz = 0.0
+        for i in prange(n):
+            ax = np.float64(vx[0, i])
+            ay = np.float64(vy[0, i])
+            az = np.float64(vz[0, i])
+            bx = np.float64(vx[1, i])
+            by = np.float64(vy[1, i])
+            bz = np.float64(vz[1, i])
+            cx = np.float64(vx[2, i])
+            cy = np.float64(vy[2, i])
+            cz = np.float64(vz[2, i])
+
+            # Area from the cross product of two edges
+            e1x = bx - ax
+            e1y = by - ay
+            e1z = bz - az
+            e2x = cx - ax
+            e2y = cy - ay
+            e2z = cz - az
+            nx = e1y * e2z - e1z * e2y
+            ny = e1z * e2x - e1x * e2z
+            nz = e1x * e2y - e1y * e2x
+            areas[i] = 0.5 * np.sqrt(nx * nx + ny * ny + nz * nz)
+
+            # Signed volume of the tetrahedron with the origin: a . (b x c) / 6
+            volume += (ax * (by * cz - bz * cy) + ay * (bz * cx - bx * cz) + az * (bx * cy - by * cx)) / 6.0
+
+            sx += ax + bx + cx
+            sy += ay + by + cy
+            sz += az + bz + cz
+
+        vertex_sum = np.empty(3, dtype=np.float64)
+        vertex_sum[0] = sx
+        vertex_sum[1] = sy
+        vertex_sum[2] = sz
+        return areas, volume, vertex_sum
+
+
+def mesh_stats(vx: np.ndarray, vy: np.ndarray, vz: np.ndarray) -> Tuple[np.ndarray, float, np.ndarray]:
+    """
+    Analyze every triangle of a mesh in one pass.
+
+    Takes the mesh in structure-of-arrays layout: one contiguous array per
+    axis, where row k holds that coordinate of every triangle's k-th vertex.
+
+    Args:
+        vx: X coordinates, shape (3, N)
+        vy: Y coordinates, shape (3, N)
+        vz: Z coordinates, shape (3, N)
+
+    Returns:
+        Tuple of (per-triangle areas, signed volume, sum of all vertices)
+    """
+    if NUMBA_AVAILABLE:
+        areas, volume, vertex_sum = _mesh_stats_numba(vx, vy, vz)
+        return areas, float(volume), vertex_sum
+    return _mesh_stats_numpy(vx, vy, vz)
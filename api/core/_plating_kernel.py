@@ -0,0 +1,120 @@
+"""
+Vectorized electroplating arithmetic.
+
+Computes current, plating time, metal mass, energy and cost for many plating
+scenarios at once. Uses the compiled Cython module (_plating_kernel_c) when
+it has been built, numba when it is installed, and falls back to an
+equivalent NumPy implementation otherwise.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+try:
+    from ._plating_kernel_c import plating_core as _plating_core_cython
+    CYTHON_AVAILABLE = True
+except ImportError:
+    CYTHON_AVAILABLE = False
+
+# Unit conversions as reciprocals, so hot paths multiply instead of divide
+_INV_645_16 = 1.0 / 645.16      # mm² -> in²
+_INV_100 = 1.0 / 100.0          # mm² -> cm²
+_INV_10000 = 1.0 / 10000.0      # µm -> cm
+_INV_25400 = 1.0 / 25400.0      # µm -> in
+_KWH_TO_WH_COST = 0.12e-3       # Electricity cost per Wh at $0.12/kWh
+
+
+def plating_rate_microns_per_min(current_density_avg):
+    """
+    Empirical base plating rate for an average current density.
+    
+    Accepts a scalar or a NumPy array of current densities (A/in²), so
+    sweeps over many densities can be computed in one call.
+    
+    Returns:
+        Base plating rate in µm/min, before current efficiency is applied
+    """
+    cd = np.asarray(current_density_avg, dtype=float)
+    # Realistic plating rates based on industry standards (µm/min at stated current densities)
+    # These rates account for typical solution conditions and current efficiency
+    return np.where(cd <= 0.05, 0.15 + cd * 2.0,           # Low current density
+                    np.where(cd <= 0.1, 0.25 + cd * 1.5,   # Standard current density
+                             0.4 + cd * 1.0))              # High current density
+
+
+def _plating_core_numpy(area_mm2, cd_min, cd_max, t_um, density, efficiency, voltage):
+    """NumPy implementation of plating_core."""
+    cd_avg = (cd_min + cd_max) / 2
+    current = area_mm2 * _INV_645_16 * cd_avg
+    time_min = t_um / (plating_rate_microns_per_min(cd_avg) * efficiency)
+    mass_g = area_mm2 * _INV_100 * (t_um * _INV_10000) * density
+    energy_wh = current * voltage * time_min / 60
+    return np.stack((current, time_min, mass_g, energy_wh, energy_wh * _KWH_TO_WH_COST, mass_g * 0.05))
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True)
+    def _plating_core_numba(area_mm2, cd_min, cd_max, t_um, density, efficiency, voltage):
+        """Numba implementation of plating_core."""
+        n = area_mm2.shape[0]
+        out = np.empty((6, n), dtype=np.float64)
+        for i in range(n):
+            cd_avg = (cd_min[i] + cd_max[i]) / 2
+            current = area_mm2[i] * _INV_645_16 * cd_avg
+
+            # Empirical plating rate in µm/min, see plating_rate_microns_per_min
+            if cd_avg <= 0.05:
+                rate = 0.15 + cd_avg * 2.0
+            elif cd_avg <= 0.1:
+                rate = 0.25 + cd_avg * 1.5
+            else:
+                rate = 0.4 + cd_avg * 1.0
+
+            time_min = t_um[i] / (rate * efficiency[i])
+            mass_g = area_mm2[i] * _INV_100 * (t_um[i] * _INV_10000) * density[i]
+            energy_wh = current * voltage[i] * time_min / 60
+
+            out[0, i] = current
+            out[1, i] = time_min
+            out[2, i] = mass_g
+            out[3, i] = energy_wh
+            out[4, i] = energy_wh * _KWH_TO_WH_COST
+            out[5, i] = mass_g * 0.05
+        return out
+
+
+def plating_core(area_mm2, cd_min, cd_max, t_um, density, efficiency=0.95, voltage=3.0) -> np.ndarray:
+    """
+    Calculate plating requirements for a batch of scenarios.
+
+    Every argument may be a scalar or a 1-D array; they are broadcast against
+    each other, so a sweep over one parameter is a single call. This is the
+    one implementation of the plating formulas: calculate_electroplating_parameters,
+    sweep_plating and PlatingContext all go through it. Full coverage is assumed.
+
+    Args:
+        area_mm2: Surface area in mm²
+        cd_min: Minimum current density in A/in²
+        cd_max: Maximum current density in A/in²
+        t_um: Plating thickness in microns
+        density: Metal density in g/cm³
+        efficiency: Current efficiency as decimal
+        voltage: Operating voltage in volts
+
+    Returns:
+        Array of shape (6, N) whose rows are current (A), plating time (min),
+        metal mass (g), energy (Wh), electricity cost ($) and solution cost ($)
+    """
+    arrays = np.broadcast_arrays(*(np.atleast_1d(np.asarray(x, dtype=np.float64))
+                                   for x in (area_mm2, cd_min, cd_max, t_um, density, efficiency, voltage)))
+    args = [np.ascontiguousarray(a) for a in arrays]
+    if CYTHON_AVAILABLE:
+        return np.asarray(_plating_core_cython(*args))
+    if NUMBA_AVAILABLE:
+        return _plating_core_numba(*args)
+    return _plating_core_numpy(*args)
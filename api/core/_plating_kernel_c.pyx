@@ -0,0 +1,58 @@
+# cython: language_level=3
+"""
+Compiled electroplating kernel for deployments without numba.
+
+Same arithmetic as _plating_kernel.plating_core. Build in place with:
+
+    cythonize -i api/core/_plating_kernel_c.pyx
+
+CI builds it and test_plating_backends_agree checks it against
+calculate_electroplating_parameters.
+"""
+
+import numpy as np
+
+cimport cython
+
+# Unit conversions as reciprocals, matching _plating_kernel
+cdef double _INV_645_16 = 1.0 / 645.16
+cdef double _INV_100 = 1.0 / 100.0
+cdef double _INV_10000 = 1.0 / 10000.0
+cdef double _KWH_TO_WH_COST = 0.12e-3
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+cpdef double[:, ::1] plating_core(double[::1] area_mm2, double[::1] cd_min, double[::1] cd_max,
+                                  double[::1] t_um, double[::1] density, double[::1] efficiency,
+                                  double[::1] voltage):
+    """Compiled implementation of _plating_kernel.plating_core."""
+    cdef Py_ssize_t i
+    cdef Py_ssize_t n = area_mm2.shape[0]
+    cdef double[:, ::1] out = np.empty((6, n), dtype=np.float64)
+    cdef double cd_avg, current, rate, time_min, mass_g, energy_wh
+
+    for i in range(n):
+        cd_avg = (cd_min[i] + cd_max[i]) / 2
+        current = area_mm2[i] * _INV_645_16 * cd_avg
+
+        # Empirical plating rate in µm/min, see plating_rate_microns_per_min
+        if cd_avg <= 0.05:
+            rate = 0.15 + cd_avg * 2.0
+        elif cd_avg <= 0.1:
+            rate = 0.25 + cd_avg * 1.5
+        else:
+            rate = 0.4 + cd_avg * 1.0
+
+        time_min = t_um[i] / (rate * efficiency[i])
+        mass_g = area_mm2[i] * _INV_100 * (t_um[i] * _INV_10000) * density[i]
+        energy_wh = current * voltage[i] * time_min / 60
+
+        out[0, i] = current
+        out[1, i] = time_min
+        out[2, i] = mass_g
+        out[3, i] = energy_wh
+        out[4, i] = energy_wh * _KWH_TO_WH_COST
+        out[5, i] = mass_g * 0.05
+    return out
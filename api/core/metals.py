@@ -0,0 +1,140 @@
+"""
+Plating metal properties.
+
+METAL_PROPERTIES holds every property per metal as a dict. METALS holds the
+numeric ones as a structured array with one row per metal, so a property can
+be read for all metals at once (METALS['density']) and a single metal's row
+is one index away: METALS[Metal.NICKEL], or METAL_INDEX for names.
+"""
+
+from enum import IntEnum
+from typing import Union
+
+import numpy as np
+
+# Full property set for each supported plating metal
+METAL_PROPERTIES = {
+    'nickel': {
+        'density_g_cm3': 8.9,
+        'current_density_min': 0.05,  # Refined: Industry standard 0.05-0.15 A/in²
+        'current_density_max': 0.15,
+        'voltage': 4.5,  # Refined: Typical 4-6V, 4.5V optimal
+        'plating_rate_inches_per_min': 0.3 / 25400,  # Refined: 0.3 µm/min typical
+        'solution_cost_per_kg': 45.0,  # Refined: Current nickel solution costs
+        'color': 'Silver-gray',
+        'hardness': 'Hard',
+        'corrosion_resistance': 'Excellent',
+        'typical_thickness_microns': 12.5,  # Refined: 10-25µm typical, 12.5µm average
+        'current_efficiency': 0.95,  # Added: Typical nickel plating efficiency
+        'temperature_c': 50  # Added: Optimal operating temperature
+    },
+    'copper': {
+        'density_g_cm3': 8.96,
+        'current_density_min': 0.05,  # Refined: Standard 0.05-0.15 A/in²
+        'current_density_max': 0.15,
+        'voltage': 2.5,  # Refined: Typical 2-4V, 2.5V optimal
+        'plating_rate_inches_per_min': 0.5 / 25400,  # Refined: 0.5 µm/min typical
+        'solution_cost_per_kg': 25.0,  # Refined: Current copper solution costs
+        'color': 'Reddish-brown',
+        'hardness': 'Soft',
+        'corrosion_resistance': 'Good',
+        'typical_thickness_microns': 25.0,  # Refined: 20-50µm typical, 25µm standard
+        'current_efficiency': 0.98,  # Added: High copper plating efficiency
+        'temperature_c': 25  # Added: Room temperature operation
+    },
+    'chrome': {
+        'density_g_cm3': 7.19,
+        'current_density_min': 0.15,  # Refined: Chrome requires higher 0.15-0.30 A/in²
+        'current_density_max': 0.30,
+        'voltage': 6.0,  # Refined: Decorative chrome 4-8V, 6V optimal
+        'plating_rate_inches_per_min': 0.15 / 25400,  # Refined: 0.15 µm/min typical
+        'solution_cost_per_kg': 120.0,  # Refined: Higher chrome solution costs
+        'color': 'Bright silver',
+        'hardness': 'Very hard',
+        'corrosion_resistance': 'Excellent',
+        'typical_thickness_microns': 0.25,  # Refined: Decorative chrome 0.2-0.5µm
+        'current_efficiency': 0.18,  # Added: Low chrome plating efficiency
+        'temperature_c': 50  # Added: Optimal operating temperature
+    },
+    'gold': {
+        'density_g_cm3': 19.32,
+        'current_density_min': 0.02,  # Refined: Gold plating 0.02-0.08 A/in²
+        'current_density_max': 0.08,
+        'voltage': 2.0,  # Refined: Low voltage 1.5-3V, 2V optimal
+        'plating_rate_inches_per_min': 0.1 / 25400,  # Refined: 0.1 µm/min typical
+        'solution_cost_per_kg': 1800.0,  # Refined: Current gold solution costs
+        'color': 'Yellow',
+        'hardness': 'Soft',
+        'corrosion_resistance': 'Excellent',
+        'typical_thickness_microns': 2.5,  # Refined: 1-5µm typical, 2.5µm standard
+        'current_efficiency': 0.85,  # Added: Good gold plating efficiency
+        'temperature_c': 60  # Added: Elevated temperature for gold
+    },
+    'silver': {
+        'density_g_cm3': 10.49,
+        'current_density_min': 0.05,  # Refined: Silver plating 0.05-0.20 A/in²
+        'current_density_max': 0.20,
+        'voltage': 1.5,  # Refined: Low voltage 1-2.5V, 1.5V optimal
+        'plating_rate_inches_per_min': 0.25 / 25400,  # Refined: 0.25 µm/min typical
+        'solution_cost_per_kg': 400.0,  # Refined: Current silver solution costs
+        'color': 'Bright silver',
+        'hardness': 'Soft',  
+        'corrosion_resistance': 'Good',
+        'typical_thickness_microns': 7.5,  # Refined: 5-15µm typical, 7.5µm standard
+        'current_efficiency': 0.90,  # Added: High silver plating efficiency
+        'temperature_c': 25  # Added: Room temperature operation
+    }
+}
+
+
+METAL_DTYPE = np.dtype([
+    ('density', 'f8'),       # g/cm³
+    ('cd_min', 'f8'),        # A/in²
+    ('cd_max', 'f8'),        # A/in²
+    ('voltage', 'f8'),       # V
+    ('thickness_um', 'f8'),  # Typical plating thickness
+    ('efficiency', 'f8')     # Current efficiency as decimal
+])
+
+
+
+class Metal(IntEnum):
+    """Supported plating metals, valued by their row in METALS."""
+    NICKEL = 0
+    COPPER = 1
+    CHROME = 2
+    GOLD = 3
+    SILVER = 4
+    
+    @property
+    def key(self) -> str:
+        """Lowercase name, as used by METAL_PROPERTIES."""
+        return self.name.lower()
+    
+    @classmethod
+    def parse(cls, metal: Union['Metal', str]) -> 'Metal':
+        """
+        Normalize a Metal or a metal name (any case) to a Metal.
+        
+        Raises:
+            ValueError: If the metal is not supported
+        """
+        if isinstance(metal, cls):
+            return metal
+        try:
+            return cls[metal.upper()]
+        except (KeyError, AttributeError):
+            raise ValueError(f"Unsupported metal type: {metal}") from None
+
+
+METAL_INDEX = {metal.key: int(metal) for metal in Metal}
+
+METALS = np.array([
+    (props['density_g_cm3'],
+     props['current_density_min'],
+     props['current_density_max'],
+     props['voltage'],
+     props['typical_thickness_microns'],
+     props['current_efficiency'])
+    for props in (METAL_PROPERTIES[metal.key] for metal in Metal)
+], dtype=METAL_DTYPE)
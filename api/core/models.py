@@ -72,6 +72,7 @@ class MeshStatistics(BaseModel):
     """Comprehensive mesh statistics response."""
     triangle_count: int
     vertex_count: int
+    unique_vertex_count: int
     surface_area: float
     volume: float
     center_of_mass: List[float]
@@ -5,15 +5,20 @@ Session manager for handling STL file uploads and maintaining session state.
 import os
 import uuid
 import time
+import hashlib
 import tempfile
 import shutil
-from typing import Dict, Optional, Tuple
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 import aiofiles
 from pathlib import Path
 import asyncio
 from functools import lru_cache
 
+import numpy as np
+from stl import mesh
+
 from .stl_tools import STLTools
 
 
@@ -29,7 +34,8 @@ class SessionManager:
     - Performance optimization with caching
     """
     
-    def __init__(self, upload_dir: Optional[str] = None, session_timeout: int = 3600, max_sessions: int = 1000):
+    def __init__(self, upload_dir: Optional[str] = None, session_timeout: int = 3600, max_sessions: int = 1000,
+                 mesh_cache_max_bytes: int = 256 * 1024 * 1024):
         """
         Initialize the session manager.
         
@@ -37,6 +43,7 @@ class SessionManager:
             upload_dir: Directory to store uploaded files (default: temp directory)
             session_timeout: Session timeout in seconds (default: 1 hour)
             max_sessions: Maximum number of concurrent sessions (default: 1000)
+            mesh_cache_max_bytes: Memory budget for parsed meshes keyed by upload content (default: 256MB)
         """
         self.upload_dir = upload_dir or tempfile.mkdtemp(prefix="stl_api_")
         self.session_timeout = session_timeout
@@ -45,6 +52,13 @@ class SessionManager:
         self.stl_instances: Dict[str, STLTools] = {}
         self._cache_stats = {"hits": 0, "misses": 0}
         
+        # Parsed mesh data keyed by SHA-256 of the uploaded bytes, in LRU order,
+        # so re-uploads of the same part skip STL parsing entirely
+        self.mesh_cache_max_bytes = mesh_cache_max_bytes
+        self._mesh_cache: "OrderedDict[bytes, np.ndarray]" = OrderedDict()
+        self._mesh_cache_bytes = 0
+        self._mesh_cache_stats = {"hits": 0, "misses": 0}
+        
         # Ensure upload directory exists
         os.makedirs(self.upload_dir, exist_ok=True)
     
@@ -78,6 +92,13 @@ class SessionManager:
         async with aiofiles.open(file_path, 'wb') as f:
             await f.write(file_content)
         
+        # Binary STL records already match numpy-stl's dtype, so prime the mesh
+        # cache straight from the bytes instead of parsing the file later
+        content_hash = hashlib.sha256(file_content).digest()
+        binary_data = self._parse_binary_stl(file_content)
+        if binary_data is not None:
+            self._cache_mesh_data(content_hash, mesh.Mesh(binary_data).data)
+        
         # Create session record
         current_time = datetime.now().isoformat()
         self.sessions[session_id] = {
@@ -86,11 +107,36 @@ class SessionManager:
             'file_size': len(file_content),
             'upload_time': current_time,
             'last_accessed': current_time,
-            'session_dir': session_dir
+            'session_dir': session_dir,
+            'content_hash': content_hash
         }
         
         return session_id, file_path
     
+    @staticmethod
+    def _parse_binary_stl(file_content: bytes) -> Optional[np.ndarray]:
+        """
+        Read a binary STL directly into numpy-stl's record layout.
+        
+        A binary STL is an 80-byte header, a uint32 triangle count and one
+        50-byte record per triangle, so a payload is treated as binary only
+        when its length matches that count exactly.
+        
+        Args:
+            file_content: Raw file content
+            
+        Returns:
+            Writable mesh data array, or None if the content is not binary STL
+        """
+        if len(file_content) < 84:
+            return None
+        
+        count = int(np.frombuffer(file_content, dtype='<u4', count=1, offset=80)[0])
+        if count == 0 or len(file_content) != 84 + count * mesh.Mesh.dtype.itemsize:
+            return None
+        
+        return np.frombuffer(file_content, dtype=mesh.Mesh.dtype, count=count, offset=84).copy()
+    
     def get_session(self, session_id: str) -> Optional[Dict]:
         """
         Get session information.
@@ -126,12 +172,59 @@ class SessionManager:
         session = self.sessions[session_id]
         try:
             stl_tools = STLTools()
-            stl_tools.load_file(session['file_path'])
+            content_hash = session.get('content_hash')
+            cached_data = self._get_cached_mesh_data(content_hash)
+            if cached_data is not None:
+                stl_tools.load_mesh(mesh.Mesh(cached_data.copy(), calculate_normals=False),
+                                    session['file_path'])
+            else:
+                stl_tools.load_file(session['file_path'])
+                self._cache_mesh_data(content_hash, stl_tools.mesh.data)
             return stl_tools
         except Exception as e:
             print(f"Error loading STL file for session {session_id}: {e}")
             return None
     
+    def _get_cached_mesh_data(self, content_hash: Optional[bytes]) -> Optional[np.ndarray]:
+        """
+        Look up parsed mesh data for an upload's content hash.
+        
+        Args:
+            content_hash: SHA-256 digest of the uploaded file
+            
+        Returns:
+            Cached mesh data (must be copied before use) or None on a miss
+        """
+        if content_hash is None or content_hash not in self._mesh_cache:
+            self._mesh_cache_stats["misses"] += 1
+            return None
+        
+        self._mesh_cache.move_to_end(content_hash)
+        self._mesh_cache_stats["hits"] += 1
+        return self._mesh_cache[content_hash]
+    
+    def _cache_mesh_data(self, content_hash: Optional[bytes], data: np.ndarray):
+        """
+        Store a copy of parsed mesh data, evicting least recently used entries
+        until the cache fits within its byte budget.
+        
+        Args:
+            content_hash: SHA-256 digest of the uploaded file
+            data: Parsed mesh data to cache
+        """
+        if content_hash is None or data.nbytes > self.mesh_cache_max_bytes:
+            return
+        
+        if content_hash in self._mesh_cache:
+            self._mesh_cache.move_to_end(content_hash)
+            return
+        
+        self._mesh_cache[content_hash] = data.copy()
+        self._mesh_cache_bytes += data.nbytes
+        while self._mesh_cache_bytes > self.mesh_cache_max_bytes:
+            _, evicted = self._mesh_cache.popitem(last=False)
+            self._mesh_cache_bytes -= evicted.nbytes
+    
     def get_stl_tools(self, session_id: str) -> Optional[STLTools]:
         """
         Get or create STLTools instance for a session.
@@ -174,14 +267,54 @@ class SessionManager:
         if session_id not in self.sessions:
             return False
         
+        success = self._remove_session(session_id)
+        
+        # Clear cache for this session
+        self._get_stl_tools_cached.cache_clear()
+        return success
+    
+    def delete_many(self, session_ids: List[str]) -> Dict[str, List[str]]:
+        """
+        Delete several sessions at once.
+        
+        The STL tools cache is cleared once for the whole batch rather than
+        once per session.
+        
+        Args:
+            session_ids: Session identifiers to delete
+            
+        Returns:
+            Dictionary with 'deleted' and 'not_found' session id lists
+        """
+        deleted = []
+        not_found = []
+        
+        for session_id in session_ids:
+            if session_id in self.sessions and self._remove_session(session_id):
+                deleted.append(session_id)
+            else:
+                not_found.append(session_id)
+        
+        if deleted:
+            self._get_stl_tools_cached.cache_clear()
+        
+        return {'deleted': deleted, 'not_found': not_found}
+    
+    def _remove_session(self, session_id: str) -> bool:
+        """
+        Remove a session's cached instance, files and record.
+        
+        Args:
+            session_id: Session identifier
+            
+        Returns:
+            True if successful, False otherwise
+        """
         try:
             # Remove STL instance from cache
             if session_id in self.stl_instances:
                 del self.stl_instances[session_id]
             
-            # Clear cache for this session
-            self._get_stl_tools_cached.cache_clear()
-            
             # Remove session directory
             session = self.sessions[session_id]
             if os.path.exists(session['session_dir']):
@@ -209,8 +342,7 @@ class SessionManager:
             if current_time - last_accessed > self.session_timeout:
                 expired_sessions.append(session_id)
         
-        for session_id in expired_sessions:
-            self.delete_session(session_id)
+        self.delete_many(expired_sessions)
         
         return len(expired_sessions)
     
@@ -285,5 +417,12 @@ class SessionManager:
                 'cache_hits': self._cache_stats["hits"],
                 'cache_misses': self._cache_stats["misses"],
                 'cache_hit_rate': self._cache_stats["hits"] / max(1, self._cache_stats["hits"] + self._cache_stats["misses"])
+            },
+            'mesh_cache': {
+                'entries': len(self._mesh_cache),
+                'size_bytes': self._mesh_cache_bytes,
+                'max_size_bytes': self.mesh_cache_max_bytes,
+                'hits': self._mesh_cache_stats["hits"],
+                'misses': self._mesh_cache_stats["misses"]
             }
         } 
\ No newline at end of file
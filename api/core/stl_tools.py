@@ -10,9 +10,10 @@ Requirements:
 - numpy-stl: pip install numpy-stl
 - numpy: pip install numpy
 - scipy: pip install scipy (for advanced features)
+- trimesh: pip install trimesh (optional, set STL_MESH_BACKEND=trimesh to use it)
 
 Usage:
-    from api.stl import STLTools
+    from api.core.stl_tools import STLTools
     
     stl_tools = STLTools()
     stl_tools.load_file("model.stl")
@@ -28,6 +29,12 @@ import os
 import json
 from typing import Dict, List, Tuple, Optional, Union
 import warnings
+from dataclasses import dataclass, asdict
+from functools import lru_cache
+
+from ._mesh_kernel import mesh_stats
+from ._plating_kernel import plating_core, plating_rate_microns_per_min, _INV_645_16, _INV_100, _INV_10000, _INV_25400
+from .metals import METAL_PROPERTIES, Metal
 
 try:
     from scipy.spatial import ConvexHull
@@ -36,6 +43,280 @@ except ImportError:
     SCIPY_AVAILABLE = False
     warnings.warn("scipy not available. Some advanced features will be disabled.")
 
+try:
+    import trimesh
+    TRIMESH_AVAILABLE = True
+except ImportError:
+    TRIMESH_AVAILABLE = False
+
+# Backend for per-triangle areas, surface area, volume, center of mass and
+# convex hull volume: 'numpy' (default) or 'trimesh'
+MESH_BACKEND = os.getenv('STL_MESH_BACKEND', 'numpy').lower()
+if MESH_BACKEND == 'trimesh' and not TRIMESH_AVAILABLE:
+    warnings.warn("STL_MESH_BACKEND=trimesh but trimesh is not installed. Falling back to numpy.")
+    MESH_BACKEND = 'numpy'
+
+# Tolerance for merging nearby vertices when indexing the mesh (0 merges exact duplicates only)
+VERTEX_MERGE_EPS = float(os.getenv('STL_VERTEX_MERGE_EPS', '0'))
+
+class _FrozenSlots:
+    """
+    Copy and pickle support for frozen dataclasses with hand-written __slots__.
+    
+    The default slot state is restored with setattr, which a frozen dataclass
+    rejects, so the state is restored through object.__setattr__ instead.
+    """
+    __slots__ = ()
+    
+    def __getstate__(self) -> tuple:
+        return tuple(getattr(self, name) for name in self.__slots__)
+    
+    def __setstate__(self, state: tuple) -> None:
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+
+
+@dataclass(frozen=True)
+class PlatingResult(_FrozenSlots):
+    """
+    Mesh-independent electroplating quantities for one set of parameters.
+    
+    Slotted and frozen: small per instance, immutable, and safe to share from
+    the _calc_plating_cached cache. (dataclass(slots=True) needs Python 3.10,
+    so __slots__ is spelled out.)
+    """
+    __slots__ = (
+        'surface_area_in2', 'min_amps', 'max_amps', 'recommended_amps',
+        'thickness_inches', 'plating_time_minutes', 'plating_rate_inches_per_min',
+        'surface_area_cm2', 'metal_volume_cm3', 'metal_mass_g', 'power_watts',
+        'energy_wh', 'electricity_cost', 'solution_cost'
+    )
+    
+    surface_area_in2: float
+    min_amps: float
+    max_amps: float
+    recommended_amps: float
+    thickness_inches: float
+    plating_time_minutes: float
+    plating_rate_inches_per_min: float  # Includes current efficiency
+    surface_area_cm2: float
+    metal_volume_cm3: float
+    metal_mass_g: float  # Before the coverage efficiency adjustment
+    power_watts: float
+    energy_wh: float
+    electricity_cost: float
+    solution_cost: float
+    
+    @property
+    def total_cost(self) -> float:
+        """Electricity plus solution cost."""
+        return self.electricity_cost + self.solution_cost
+    
+    def as_dict(self) -> Dict[str, float]:
+        """Get the result as a flat dict, including total_cost."""
+        result = asdict(self)
+        result['total_cost'] = self.total_cost
+        return result
+
+
+@lru_cache(maxsize=256)
+def _calc_plating_cached(area_mm2: float, cd_min: float, cd_max: float, t_um: float,
+                         density: float, eff: float, voltage: float) -> PlatingResult:
+    """
+    Mesh-independent part of calculate_electroplating_parameters.
+    
+    Depends only on hashable scalars, so repeat calls with the same inputs
+    are served from the cache. Current, time, mass, energy and cost come
+    from plating_core, so they match sweep_plating and PlatingContext.
+    
+    Returns:
+        PlatingResult: Current, time, material, power and cost figures
+    """
+    # tolist() gives plain floats, which every JSON encoder accepts
+    (current_recommended, plating_time_minutes, metal_mass_g,
+     energy_wh, electricity_cost, solution_cost) = plating_core(
+        area_mm2, cd_min, cd_max, t_um, density, eff, voltage
+    )[:, 0].tolist()
+    
+    surface_area_in2 = area_mm2 * _INV_645_16  # Convert mm² to in²
+    surface_area_cm2 = area_mm2 * _INV_100  # Convert mm² to cm²
+    
+    # Empirical plating rate with current efficiency applied, in inches per minute
+    actual_plating_rate = float(plating_rate_microns_per_min((cd_min + cd_max) / 2)) * eff * _INV_25400
+    
+    return PlatingResult(
+        surface_area_in2=surface_area_in2,
+        min_amps=surface_area_in2 * cd_min,
+        max_amps=surface_area_in2 * cd_max,
+        recommended_amps=current_recommended,
+        thickness_inches=t_um * _INV_25400,
+        plating_time_minutes=plating_time_minutes,
+        plating_rate_inches_per_min=actual_plating_rate,
+        surface_area_cm2=surface_area_cm2,
+        metal_volume_cm3=surface_area_cm2 * (t_um * _INV_10000),
+        metal_mass_g=metal_mass_g,
+        power_watts=current_recommended * voltage,
+        energy_wh=energy_wh,
+        electricity_cost=electricity_cost,
+        solution_cost=solution_cost
+    )
+
+
+# Fields returned by sweep_plating
+SWEEP_DTYPE = np.dtype([
+    ('current_a', 'f8'),
+    ('time_min', 'f8'),
+    ('mass_g', 'f8'),
+    ('energy_wh', 'f8'),
+    ('electricity_cost', 'f8'),
+    ('solution_cost', 'f8'),
+    ('cost_total', 'f8')
+])
+
+
+def sweep_plating(area_mm2: float,
+                  thickness_um: Union[float, np.ndarray] = 80.0,
+                  cd: Union[float, np.ndarray] = 0.085,
+                  density: Union[float, np.ndarray] = 8.96,
+                  voltage: Union[float, np.ndarray] = 3.0,
+                  efficiency: Union[float, np.ndarray] = 0.95) -> np.ndarray:
+    """
+    Calculate plating requirements over a sweep of plating parameters.
+    
+    All parameters after area_mm2 broadcast against each other, so passing
+    thicknesses[:, None] and a 1-D cd array gives a 2-D grid, and per-metal
+    arrays compare several metals at once. Full coverage is assumed; use
+    calculate_electroplating_parameters for a loaded mesh.
+    
+    Args:
+        area_mm2: Surface area in mm²
+        thickness_um: Plating thickness(es) in microns
+        cd: Average current density(ies) in A/in²
+        density: Metal density(ies) in g/cm³ (default: 8.96 for copper)
+        voltage: Operating voltage(s) in volts
+        efficiency: Current efficiency(ies) as decimal
+        
+    Returns:
+        Structured array of SWEEP_DTYPE with the broadcast shape of the inputs
+    """
+    arrays = np.broadcast_arrays(*(np.asarray(x, dtype=float) for x in (thickness_um, cd, density, voltage, efficiency)))
+    thickness_um, cd, density, voltage, efficiency = (a.ravel() for a in arrays)
+    current, time_min, mass_g, energy_wh, electricity_cost, solution_cost = plating_core(
+        area_mm2, cd, cd, thickness_um, density, efficiency, voltage
+    )
+    
+    result = np.empty(arrays[0].shape, dtype=SWEEP_DTYPE)
+    result['current_a'] = current.reshape(result.shape)
+    result['time_min'] = time_min.reshape(result.shape)
+    result['mass_g'] = mass_g.reshape(result.shape)
+    result['energy_wh'] = energy_wh.reshape(result.shape)
+    result['electricity_cost'] = electricity_cost.reshape(result.shape)
+    result['solution_cost'] = solution_cost.reshape(result.shape)
+    result['cost_total'] = result['electricity_cost'] + result['solution_cost']
+    return result
+
+
+@lru_cache(maxsize=None)
+def _metal_specific_tips(metal_type: str) -> Dict[str, Tuple[str, ...]]:
+    """Build the plating tips for get_electroplating_recommendations, once per metal."""
+    props = METAL_PROPERTIES[metal_type]
+    return {
+        'nickel': (
+            "Use bright nickel for decorative finish, semi-bright for underlayer",
+            "Maintain pH between 3.8-4.2 for optimal results",
+            f"Operating temperature: {props.get('temperature_c', 50)}°C ±5°C",
+            f"Current efficiency: {props.get('current_efficiency', 0.95)*100:.0f}% - excellent efficiency",
+            "Typical thickness: 10-25µm for decorative applications",
+            "Requires good agitation for uniform deposit",
+            "Pre-treatment: Alkaline clean + acid activation essential"
+        ),
+        'copper': (
+            "Excellent base layer - high conductivity and ductility",
+            "Use pyrophosphate or sulfate solutions (avoid cyanide)",
+            "Maintain pH between 8.0-9.0 for pyrophosphate baths",
+            f"Operating temperature: {props.get('temperature_c', 25)}°C (room temperature)",
+            f"Current efficiency: {props.get('current_efficiency', 0.98)*100:.0f}% - highest among common metals",
+            "Typical thickness: 20-50µm for functional applications",
+            "Excellent throwing power - good for complex geometries"
+        ),
+        'chrome': (
+            "CRITICAL: Requires nickel underlayer (10-15µm minimum)",
+            "Decorative chrome: 0.2-0.5µm thickness only",
+            f"Operating temperature: {props.get('temperature_c', 50)}°C ±3°C",
+            f"Current efficiency: {props.get('current_efficiency', 0.18)*100:.0f}% - requires high current density",
+            "WARNING: Low current efficiency - high energy consumption",
+            "Requires excellent ventilation - toxic fumes",
+            "Hard chrome (different process): 25-250µm for wear resistance"
+        ),
+        'gold': (
+            "Premium finish - excellent corrosion resistance",
+            "Flash gold (0.1-0.5µm) for cost-effective decorative finish",
+            "Maintain pH between 4.2-4.8 for neutral gold baths",
+            f"Operating temperature: {props.get('temperature_c', 60)}°C for optimal deposit",
+            f"Current efficiency: {props.get('current_efficiency', 0.85)*100:.0f}% - good efficiency at low current density",
+            "Typical thickness: 1-5µm (2.5µm standard)",
+            "Requires nickel barrier layer to prevent migration"
+        ),
+        'silver': (
+            "Highest electrical conductivity of all metals",
+            "Bright silver solutions for decorative applications",
+            "Maintain pH between 8.5-9.5 for cyanide-free solutions",
+            f"Operating temperature: {props.get('temperature_c', 25)}°C (room temperature)",
+            f"Current efficiency: {props.get('current_efficiency', 0.90)*100:.0f}% - very high efficiency",
+            "Typical thickness: 5-15µm for functional applications",
+            "Prone to tarnishing - consider protective topcoat"
+        )
+    }
+
+
+@dataclass(frozen=True)
+class PlatingContext(_FrozenSlots):
+    """
+    Thickness-independent plating inputs for one metal and part.
+    
+    Built by STLTools.prepare_plating_context, which resolves the metal's
+    defaults and the part's surface area once; each for_thickness call is a
+    single plating_core batch.
+    """
+    __slots__ = (
+        'area_mm2', 'area_in2', 'current_a', 'current_density',
+        'density_g_cm3', 'efficiency', 'voltage'
+    )
+    
+    area_mm2: float
+    area_in2: float
+    current_a: float
+    current_density: float  # Average, in A/in²
+    density_g_cm3: float
+    efficiency: float
+    voltage: float
+    
+    def for_thickness(self, t_um: Union[float, np.ndarray]) -> Dict[str, Union[float, np.ndarray]]:
+        """
+        Calculate the thickness-dependent plating quantities.
+        
+        Args:
+            t_um: Plating thickness in microns, or an array of thicknesses
+            
+        Returns:
+            dict: Plating time, metal mass, energy and cost for each thickness
+        """
+        rows = plating_core(self.area_mm2, self.current_density, self.current_density, t_um,
+                            self.density_g_cm3, self.efficiency, self.voltage)
+        # A scalar thickness gets plain floats back, an array its own shape
+        rows = rows[:, 0].tolist() if np.ndim(t_um) == 0 else rows.reshape((6,) + np.shape(t_um))
+        _, plating_time_minutes, metal_mass_g, energy_wh, electricity_cost, solution_cost = rows
+        return {
+            'thickness_microns': t_um,
+            'plating_time_minutes': plating_time_minutes,
+            'metal_mass_g': metal_mass_g,
+            'energy_wh': energy_wh,
+            'electricity_cost': electricity_cost,
+            'solution_cost': solution_cost,
+            'total_cost': electricity_cost + solution_cost
+        }
+
+
 class STLTools:
     """
     A comprehensive toolkit for STL file manipulation and analysis.
@@ -57,6 +338,10 @@ class STLTools:
         self._cached_volume = None
         self._cached_bounds = None
         self._cached_center_of_mass = None
+        self._cached_triangle_areas = None
+        self._cached_coordinates = None
+        self._cached_indexed_vertices = None
+        self._cached_hull_volume = None
         
     def load_file(self, file_path: str) -> bool:
         """
@@ -79,12 +364,99 @@ class STLTools:
         except Exception as e:
             raise ValueError(f"Error loading STL file: {e}")
     
+    def load_mesh(self, stl_mesh: mesh.Mesh, file_path: Optional[str] = None) -> bool:
+        """
+        Load an already parsed mesh into the instance.
+        
+        Args:
+            stl_mesh: Parsed numpy-stl mesh
+            file_path: Path the mesh was originally loaded from, if any
+            
+        Returns:
+            bool: True if successful
+        """
+        self.mesh = stl_mesh
+        self.file_path = file_path
+        self._clear_cache()
+        return True
+    
     def _clear_cache(self):
         """Clear all cached calculations."""
         self._cached_surface_area = None
         self._cached_volume = None
         self._cached_bounds = None
         self._cached_center_of_mass = None
+        self._cached_triangle_areas = None
+        self._cached_coordinates = None
+        self._cached_indexed_vertices = None
+        self._cached_hull_volume = None
+    
+    def _get_coordinate_arrays(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Get the mesh vertices as one contiguous array per axis.
+        
+        numpy-stl stores vertices inside 50-byte records, so per-axis passes
+        over mesh.vectors are strided. This structure-of-arrays copy keeps
+        each coordinate contiguous for the analysis kernel and reductions.
+        
+        Returns:
+            Tuple of (vx, vy, vz) float32 arrays of shape (3, N), where row k
+            holds that coordinate of every triangle's k-th vertex
+        """
+        if self._cached_coordinates is None:
+            vectors = self.mesh.vectors
+            self._cached_coordinates = tuple(
+                np.ascontiguousarray(vectors[:, :, axis].T, dtype=np.float32) for axis in range(3)
+            )
+        return self._cached_coordinates
+    
+    def get_indexed_vertices(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get the mesh as a deduplicated vertex list plus a triangle index list.
+        
+        STL stores every shared vertex once per adjacent triangle, so most
+        vertices appear several times. Vertices closer than VERTEX_MERGE_EPS
+        are merged into one.
+        
+        Returns:
+            Tuple of (vertex_list, index_list): unique vertices of shape (M, 3)
+            and, for each triangle, the indices of its three vertices (N, 3)
+        """
+        self._ensure_mesh_loaded()
+        
+        if self._cached_indexed_vertices is None:
+            flat = np.ascontiguousarray(self.mesh.vectors.reshape(-1, 3))
+            keys = np.round(flat / VERTEX_MERGE_EPS) if VERTEX_MERGE_EPS > 0 else flat
+            keys = np.ascontiguousarray(keys)
+            # View each row as a single record so np.unique compares whole vertices
+            _, first, inverse = np.unique(
+                keys.view([('', keys.dtype)] * 3), return_index=True, return_inverse=True
+            )
+            self._cached_indexed_vertices = (flat[first], inverse.reshape(-1, 3))
+        return self._cached_indexed_vertices
+    
+    def _analyze_triangles(self):
+        """
+        Analyze every triangle once and cache everything that produces:
+        per-triangle areas, center of mass, surface area and volume.
+        
+        Uses the fused mesh kernel on the numpy backend and trimesh's
+        triangle routines on the trimesh backend.
+        """
+        if MESH_BACKEND == 'trimesh':
+            triangles = self.mesh.vectors.astype(np.float64)
+            areas = trimesh.triangles.area(triangles)
+            signed_volume = float(trimesh.triangles.mass_properties(triangles)['volume'])
+            vertex_sum = triangles.reshape(-1, 3).sum(axis=0)
+        else:
+            areas, signed_volume, vertex_sum = mesh_stats(*self._get_coordinate_arrays())
+        self._cached_triangle_areas = areas
+        if self._cached_center_of_mass is None:
+            self._cached_center_of_mass = vertex_sum / max(1, 3 * len(areas))
+        if self._cached_surface_area is None:
+            self._cached_surface_area = float(np.sum(areas))
+        if self._cached_volume is None:
+            self._cached_volume = abs(signed_volume)
     
     def _ensure_mesh_loaded(self):
         """Ensure a mesh is loaded before performing operations."""
@@ -100,16 +472,21 @@ class STLTools:
         """
         self._ensure_mesh_loaded()
         
-        if self._cached_surface_area is not None:
-            return self._cached_surface_area
+        if self._cached_surface_area is None:
+            self._analyze_triangles()
         
-        total_area = 0.0
-        for triangle in self.mesh.vectors:
-            area = self._calculate_triangle_area(triangle)
-            total_area += area
+        return self._cached_surface_area
+    
+    def _calculate_triangle_areas(self) -> np.ndarray:
+        """
+        Calculate the area of every triangle in the mesh at once.
         
-        self._cached_surface_area = total_area
-        return total_area
+        Returns:
+            np.ndarray: Array of shape (N,) with one area per triangle
+        """
+        if self._cached_triangle_areas is None:
+            self._analyze_triangles()
+        return self._cached_triangle_areas
     
     def _calculate_triangle_area(self, vertices: np.ndarray) -> float:
         """
@@ -136,17 +513,9 @@ class STLTools:
         """
         self._ensure_mesh_loaded()
         
-        if self._cached_volume is not None:
-            return self._cached_volume
-        
-        volume = 0.0
-        for triangle in self.mesh.vectors:
-            v0, v1, v2 = triangle
-            # Volume contribution from this triangle
-            vol = np.dot(v0, np.cross(v1, v2)) / 6.0
-            volume += vol
+        if self._cached_volume is None:
+            self._analyze_triangles()
         
-        self._cached_volume = abs(volume)
         return self._cached_volume
     
     def get_bounding_box(self) -> Dict[str, np.ndarray]:
@@ -161,9 +530,9 @@ class STLTools:
         if self._cached_bounds is not None:
             return self._cached_bounds
         
-        all_vertices = self.mesh.vectors.reshape(-1, 3)
-        min_coords = np.min(all_vertices, axis=0)
-        max_coords = np.max(all_vertices, axis=0)
+        coordinates = self._get_coordinate_arrays()
+        min_coords = np.array([axis.min() for axis in coordinates])
+        max_coords = np.array([axis.max() for axis in coordinates])
         dimensions = max_coords - min_coords
         
         bounds = {
@@ -187,11 +556,8 @@ class STLTools:
         if self._cached_center_of_mass is not None:
             return self._cached_center_of_mass
         
-        all_vertices = self.mesh.vectors.reshape(-1, 3)
-        center = np.mean(all_vertices, axis=0)
-        
-        self._cached_center_of_mass = center
-        return center
+        self._analyze_triangles()
+        return self._cached_center_of_mass
     
     def get_mesh_statistics(self) -> Dict:
         """
@@ -209,20 +575,15 @@ class STLTools:
         
         # Calculate triangle statistics
         triangles = self.mesh.vectors
-        areas = [self._calculate_triangle_area(tri) for tri in triangles]
+        areas = self._calculate_triangle_areas()
         
-        # Calculate edge lengths
-        edges = []
-        for tri in triangles:
-            edges.extend([
-                np.linalg.norm(tri[1] - tri[0]),
-                np.linalg.norm(tri[2] - tri[1]),
-                np.linalg.norm(tri[0] - tri[2])
-            ])
+        # Calculate edge lengths (v1-v0, v2-v1, v0-v2 for each triangle)
+        edges = np.linalg.norm(triangles[:, [1, 2, 0]] - triangles, axis=2).ravel()
         
         stats = {
             'triangle_count': len(triangles),
             'vertex_count': len(triangles) * 3,
+            'unique_vertex_count': len(self.get_indexed_vertices()[0]),
             'surface_area': surface_area,
             'volume': volume,
             'center_of_mass': center.tolist(),
@@ -232,14 +593,14 @@ class STLTools:
                 'dimensions': bounds['dimensions'].tolist()
             },
             'triangle_areas': {
-                'min': min(areas),
-                'max': max(areas),
+                'min': float(np.min(areas)),
+                'max': float(np.max(areas)),
                 'mean': np.mean(areas),
                 'std': np.std(areas)
             },
             'edge_lengths': {
-                'min': min(edges),
-                'max': max(edges),
+                'min': float(np.min(edges)),
+                'max': float(np.max(edges)),
                 'mean': np.mean(edges),
                 'std': np.std(edges)
             },
@@ -267,11 +628,8 @@ class STLTools:
         warnings = []
         
         # Check for degenerate triangles
-        degenerate_triangles = []
-        for i, triangle in enumerate(self.mesh.vectors):
-            area = self._calculate_triangle_area(triangle)
-            if area < 1e-10:  # Very small area threshold
-                degenerate_triangles.append(i)
+        areas = self._calculate_triangle_areas()
+        degenerate_triangles = np.flatnonzero(areas < 1e-10).tolist()  # Very small area threshold
         
         if degenerate_triangles:
             issues.append(f"Found {len(degenerate_triangles)} degenerate triangles")
@@ -310,9 +668,15 @@ class STLTools:
         
         self._ensure_mesh_loaded()
         
-        all_vertices = self.mesh.vectors.reshape(-1, 3)
-        hull = ConvexHull(all_vertices)
-        return hull.volume
+        if self._cached_hull_volume is None:
+            # Qhull only needs each shared vertex once
+            unique_vertices, _ = self.get_indexed_vertices()
+            if MESH_BACKEND == 'trimesh':
+                hull = trimesh.convex.convex_hull(unique_vertices)
+            else:
+                hull = ConvexHull(unique_vertices)
+            self._cached_hull_volume = float(hull.volume)
+        return self._cached_hull_volume
     
     def export_statistics(self, output_file: str, format: str = 'json') -> bool:
         """
@@ -354,6 +718,7 @@ class STLTools:
                     f.write(f"File: {self.file_path}\n")
                     f.write(f"Triangle Count: {stats['triangle_count']:,}\n")
                     f.write(f"Vertex Count: {stats['vertex_count']:,}\n")
+                    f.write(f"Unique Vertex Count: {stats['unique_vertex_count']:,}\n")
                     f.write(f"Surface Area: {stats['surface_area']:.6f}\n")
                     f.write(f"Volume: {stats['volume']:.6f}\n")
                     f.write(f"Center of Mass: {stats['center_of_mass']}\n")
@@ -509,57 +874,13 @@ class STLTools:
         """
         self._ensure_mesh_loaded()
         
-        # Get surface area in mm² and convert to square inches
         surface_area_mm2 = self.calculate_surface_area()
-        surface_area_in2 = surface_area_mm2 / 645.16  # Convert mm² to in²
-        
-        # Calculate current requirements
-        current_min = surface_area_in2 * current_density_min
-        current_max = surface_area_in2 * current_density_max
-        current_recommended = (current_min + current_max) / 2
-        
-        # Calculate plating time based on thickness and plating rate
-        plating_thickness_inches = plating_thickness_microns / 25400
-        
-        # Calculate realistic plating rate based on Faraday's law and empirical data
-        # Formula: Rate = (Current Density × Current Efficiency × Atomic Weight) / (n × F × Density)
-        # For practical use, we use empirically validated rates based on current density
-        current_density_avg = (current_density_min + current_density_max) / 2
-        
-        # Realistic plating rates based on industry standards (µm/min at stated current densities)
-        # These rates account for typical solution conditions and current efficiency
-        if current_density_avg <= 0.05:  # Low current density
-            base_rate_microns_per_min = 0.15 + (current_density_avg * 2.0)
-        elif current_density_avg <= 0.1:  # Standard current density
-            base_rate_microns_per_min = 0.25 + (current_density_avg * 1.5)
-        else:  # High current density
-            base_rate_microns_per_min = 0.4 + (current_density_avg * 1.0)
-        
-        # Apply current efficiency
-        actual_rate_microns_per_min = base_rate_microns_per_min * current_efficiency
-        
-        # Convert to inches per minute for calculation
-        actual_plating_rate = actual_rate_microns_per_min / 25400
-        
-        # Calculate plating time using the formula: time = thickness / rate
-        plating_time_minutes = plating_thickness_inches / actual_plating_rate
-        plating_time_hours = plating_time_minutes / 60
-        
-        # Calculate metal mass required
-        surface_area_cm2 = surface_area_mm2 / 100  # Convert mm² to cm²
-        plating_thickness_cm = plating_thickness_microns / 10000  # Convert microns to cm
-        metal_volume_cm3 = surface_area_cm2 * plating_thickness_cm
-        metal_mass_g = metal_volume_cm3 * metal_density_g_cm3
-        
-        # Calculate power requirements
-        power_watts = current_recommended * voltage
-        
-        # Calculate energy consumption
-        energy_wh = power_watts * plating_time_hours
-        
-        # Calculate cost estimates (assuming $0.12/kWh and $50/kg for plating solution)
-        electricity_cost = energy_wh * 0.12 / 1000  # Convert Wh to kWh
-        solution_cost = metal_mass_g * 0.05  # Rough estimate: $50/kg = $0.05/g
+        result = _calc_plating_cached(
+            float(surface_area_mm2), float(current_density_min), float(current_density_max),
+            float(plating_thickness_microns), float(metal_density_g_cm3),
+            float(current_efficiency), float(voltage)
+        )
+        plating_time_hours = result.plating_time_minutes / 60
         
         # Calculate surface finish considerations
         surface_roughness_factor = self._calculate_surface_roughness_factor()
@@ -568,47 +889,47 @@ class STLTools:
         coverage_efficiency = self._calculate_coverage_efficiency()
         
         # Adjust calculations for coverage efficiency
-        adjusted_metal_mass_g = metal_mass_g / coverage_efficiency
+        adjusted_metal_mass_g = result.metal_mass_g / coverage_efficiency
         
         return {
             'surface_area': {
                 'mm2': surface_area_mm2,
-                'cm2': surface_area_cm2,
-                'in2': surface_area_in2
+                'cm2': result.surface_area_cm2,
+                'in2': result.surface_area_in2
             },
             'current_requirements': {
-                'min_amps': current_min,
-                'max_amps': current_max,
-                'recommended_amps': current_recommended,
+                'min_amps': result.min_amps,
+                'max_amps': result.max_amps,
+                'recommended_amps': result.recommended_amps,
                 'current_density_range': {
                     'min': current_density_min,
                     'max': current_density_max,
-                    'recommended': current_recommended / surface_area_in2
+                    'recommended': result.recommended_amps / result.surface_area_in2
                 }
             },
             'plating_parameters': {
                 'thickness_microns': plating_thickness_microns,
-                'thickness_inches': plating_thickness_inches,
-                'plating_time_minutes': plating_time_minutes,
+                'thickness_inches': result.thickness_inches,
+                'plating_time_minutes': result.plating_time_minutes,
                 'plating_time_hours': plating_time_hours,
-                'plating_rate_inches_per_min': actual_plating_rate
+                'plating_rate_inches_per_min': result.plating_rate_inches_per_min
             },
             'material_requirements': {
                 'metal_mass_g': adjusted_metal_mass_g,
                 'metal_mass_kg': adjusted_metal_mass_g / 1000,
-                'metal_volume_cm3': metal_volume_cm3,
+                'metal_volume_cm3': result.metal_volume_cm3,
                 'metal_density_g_cm3': metal_density_g_cm3
             },
             'power_requirements': {
                 'voltage': voltage,
-                'power_watts': power_watts,
-                'energy_wh': energy_wh,
-                'energy_kwh': energy_wh / 1000
+                'power_watts': result.power_watts,
+                'energy_wh': result.energy_wh,
+                'energy_kwh': result.energy_wh / 1000
             },
             'cost_estimates': {
-                'electricity_cost': electricity_cost,
-                'solution_cost': solution_cost,
-                'total_cost': electricity_cost + solution_cost
+                'electricity_cost': result.electricity_cost,
+                'solution_cost': result.solution_cost,
+                'total_cost': result.total_cost
             },
             'quality_factors': {
                 'surface_roughness_factor': surface_roughness_factor,
@@ -616,15 +937,57 @@ class STLTools:
                 'current_efficiency': current_efficiency
             },
             'recommendations': {
-                'current_setting': f"{current_recommended:.2f} A",
+                'current_setting': f"{result.recommended_amps:.2f} A",
                 'voltage_setting': f"{voltage:.1f} V",
-                'time_setting': f"{plating_time_minutes:.0f} minutes ({plating_time_hours:.0f} hours)",
+                'time_setting': f"{result.plating_time_minutes:.0f} minutes ({plating_time_hours:.0f} hours)",
                 'surface_preparation': "Sand to 400-600 grit for best adhesion",
                 'solution_temperature': "45-55°C for optimal plating rate",
                 'agitation': "Moderate agitation recommended for uniform coverage"
             }
         }
 
+    def prepare_plating_context(self,
+                                metal: Union[Metal, str] = Metal.COPPER,
+                                current_density: Optional[float] = None,
+                                voltage: Optional[float] = None,
+                                efficiency: Optional[float] = None,
+                                surface_area_mm2: Optional[float] = None) -> PlatingContext:
+        """
+        Precompute everything about a plating job that does not depend on thickness.
+        
+        Args:
+            metal: Plating metal, as a Metal or its name ('nickel', 'copper', 'chrome', 'gold', 'silver')
+            current_density: Average current density in A/in² (default: the metal's mid-range)
+            voltage: Operating voltage in volts (default: the metal's voltage)
+            efficiency: Current efficiency as decimal (default: the metal's efficiency)
+            surface_area_mm2: Surface area to plate (default: the loaded mesh's surface area)
+            
+        Returns:
+            PlatingContext: Call for_thickness() on it for each thickness
+        """
+        props = METAL_PROPERTIES[Metal.parse(metal).key]
+        
+        if current_density is None:
+            current_density = (props['current_density_min'] + props['current_density_max']) / 2
+        if voltage is None:
+            voltage = props['voltage']
+        if efficiency is None:
+            efficiency = props['current_efficiency']
+        if surface_area_mm2 is None:
+            self._ensure_mesh_loaded()
+            surface_area_mm2 = self.calculate_surface_area()
+        
+        area_in2 = surface_area_mm2 * _INV_645_16
+        return PlatingContext(
+            area_mm2=float(surface_area_mm2),
+            area_in2=area_in2,
+            current_a=area_in2 * current_density,
+            current_density=current_density,
+            density_g_cm3=props['density_g_cm3'],
+            efficiency=efficiency,
+            voltage=voltage
+        )
+
     def _calculate_surface_roughness_factor(self) -> float:
         """
         Calculate a factor that accounts for surface roughness affecting plating quality.
@@ -635,8 +998,7 @@ class STLTools:
         self._ensure_mesh_loaded()
         
         # Analyze triangle areas to estimate surface roughness
-        triangles = self.mesh.vectors
-        areas = [self._calculate_triangle_area(tri) for tri in triangles]
+        areas = self._calculate_triangle_areas()
         
         # Calculate coefficient of variation of triangle areas
         mean_area = np.mean(areas)
@@ -673,93 +1035,18 @@ class STLTools:
         efficiency = 1.0 - (aspect_factor * 0.15) - (sa_v_factor * 0.15)
         return max(efficiency, 0.7)  # Minimum 70% efficiency
 
-    def get_electroplating_recommendations(self, metal_type: str = 'copper') -> dict:
+    def get_electroplating_recommendations(self, metal_type: Union[Metal, str] = Metal.COPPER) -> dict:
         """
         Get specific recommendations for different plating metals.
         
         Args:
-            metal_type: Type of metal for plating ('nickel', 'copper', 'chrome', 'gold', 'silver')
+            metal_type: Type of metal for plating, as a Metal or its name ('nickel', 'copper', 'chrome', 'gold', 'silver')
             
         Returns:
             dict: Metal-specific recommendations
         """
-        metal_properties = {
-            'nickel': {
-                'density_g_cm3': 8.9,
-                'current_density_min': 0.05,  # Refined: Industry standard 0.05-0.15 A/in²
-                'current_density_max': 0.15,
-                'voltage': 4.5,  # Refined: Typical 4-6V, 4.5V optimal
-                'plating_rate_inches_per_min': 0.3 / 25400,  # Refined: 0.3 µm/min typical
-                'solution_cost_per_kg': 45.0,  # Refined: Current nickel solution costs
-                'color': 'Silver-gray',
-                'hardness': 'Hard',
-                'corrosion_resistance': 'Excellent',
-                'typical_thickness_microns': 12.5,  # Refined: 10-25µm typical, 12.5µm average
-                'current_efficiency': 0.95,  # Added: Typical nickel plating efficiency
-                'temperature_c': 50  # Added: Optimal operating temperature
-            },
-            'copper': {
-                'density_g_cm3': 8.96,
-                'current_density_min': 0.05,  # Refined: Standard 0.05-0.15 A/in²
-                'current_density_max': 0.15,
-                'voltage': 2.5,  # Refined: Typical 2-4V, 2.5V optimal
-                'plating_rate_inches_per_min': 0.5 / 25400,  # Refined: 0.5 µm/min typical
-                'solution_cost_per_kg': 25.0,  # Refined: Current copper solution costs
-                'color': 'Reddish-brown',
-                'hardness': 'Soft',
-                'corrosion_resistance': 'Good',
-                'typical_thickness_microns': 25.0,  # Refined: 20-50µm typical, 25µm standard
-                'current_efficiency': 0.98,  # Added: High copper plating efficiency
-                'temperature_c': 25  # Added: Room temperature operation
-            },
-            'chrome': {
-                'density_g_cm3': 7.19,
-                'current_density_min': 0.15,  # Refined: Chrome requires higher 0.15-0.30 A/in²
-                'current_density_max': 0.30,
-                'voltage': 6.0,  # Refined: Decorative chrome 4-8V, 6V optimal
-                'plating_rate_inches_per_min': 0.15 / 25400,  # Refined: 0.15 µm/min typical
-                'solution_cost_per_kg': 120.0,  # Refined: Higher chrome solution costs
-                'color': 'Bright silver',
-                'hardness': 'Very hard',
-                'corrosion_resistance': 'Excellent',
-                'typical_thickness_microns': 0.25,  # Refined: Decorative chrome 0.2-0.5µm
-                'current_efficiency': 0.18,  # Added: Low chrome plating efficiency
-                'temperature_c': 50  # Added: Optimal operating temperature
-            },
-            'gold': {
-                'density_g_cm3': 19.32,
-                'current_density_min': 0.02,  # Refined: Gold plating 0.02-0.08 A/in²
-                'current_density_max': 0.08,
-                'voltage': 2.0,  # Refined: Low voltage 1.5-3V, 2V optimal
-                'plating_rate_inches_per_min': 0.1 / 25400,  # Refined: 0.1 µm/min typical
-                'solution_cost_per_kg': 1800.0,  # Refined: Current gold solution costs
-                'color': 'Yellow',
-                'hardness': 'Soft',
-                'corrosion_resistance': 'Excellent',
-                'typical_thickness_microns': 2.5,  # Refined: 1-5µm typical, 2.5µm standard
-                'current_efficiency': 0.85,  # Added: Good gold plating efficiency
-                'temperature_c': 60  # Added: Elevated temperature for gold
-            },
-            'silver': {
-                'density_g_cm3': 10.49,
-                'current_density_min': 0.05,  # Refined: Silver plating 0.05-0.20 A/in²
-                'current_density_max': 0.20,
-                'voltage': 1.5,  # Refined: Low voltage 1-2.5V, 1.5V optimal
-                'plating_rate_inches_per_min': 0.25 / 25400,  # Refined: 0.25 µm/min typical
-                'solution_cost_per_kg': 400.0,  # Refined: Current silver solution costs
-                'color': 'Bright silver',
-                'hardness': 'Soft',  
-                'corrosion_resistance': 'Good',
-                'typical_thickness_microns': 7.5,  # Refined: 5-15µm typical, 7.5µm standard
-                'current_efficiency': 0.90,  # Added: High silver plating efficiency
-                'temperature_c': 25  # Added: Room temperature operation
-            }
-        }
-        
-        if metal_type.lower() not in metal_properties:
-            raise ValueError(f"Unsupported metal type: {metal_type}")
-        
-        props = metal_properties[metal_type.lower()]
+        metal = Metal.parse(metal_type)
+        props = dict(METAL_PROPERTIES[metal.key])
         
         # Calculate parameters using metal-specific properties
         plating_params = self.calculate_electroplating_parameters(
@@ -776,51 +1063,7 @@ class STLTools:
             'metal_properties': props,
             'calculated_parameters': plating_params,
             'metal_specific_tips': {
-                'nickel': [
-                    "Use bright nickel for decorative finish, semi-bright for underlayer",
-                    "Maintain pH between 3.8-4.2 for optimal results",
-                    f"Operating temperature: {props.get('temperature_c', 50)}°C ±5°C",
-                    f"Current efficiency: {props.get('current_efficiency', 0.95)*100:.0f}% - excellent efficiency",
-                    "Typical thickness: 10-25µm for decorative applications",
-                    "Requires good agitation for uniform deposit",
-                    "Pre-treatment: Alkaline clean + acid activation essential"
-                ],
-                'copper': [
-                    "Excellent base layer - high conductivity and ductility",
-                    "Use pyrophosphate or sulfate solutions (avoid cyanide)",
-                    "Maintain pH between 8.0-9.0 for pyrophosphate baths",
-                    f"Operating temperature: {props.get('temperature_c', 25)}°C (room temperature)",
-                    f"Current efficiency: {props.get('current_efficiency', 0.98)*100:.0f}% - highest among common metals",
-                    "Typical thickness: 20-50µm for functional applications",
-                    "Excellent throwing power - good for complex geometries"
-                ],
-                'chrome': [
-                    "CRITICAL: Requires nickel underlayer (10-15µm minimum)",
-                    "Decorative chrome: 0.2-0.5µm thickness only",
-                    f"Operating temperature: {props.get('temperature_c', 50)}°C ±3°C",
-                    f"Current efficiency: {props.get('current_efficiency', 0.18)*100:.0f}% - requires high current density",
-                    "WARNING: Low current efficiency - high energy consumption",
-                    "Requires excellent ventilation - toxic fumes",
-                    "Hard chrome (different process): 25-250µm for wear resistance"
-                ],
-                'gold': [
-                    "Premium finish - excellent corrosion resistance",
-                    "Flash gold (0.1-0.5µm) for cost-effective decorative finish",
-                    "Maintain pH between 4.2-4.8 for neutral gold baths",
-                    f"Operating temperature: {props.get('temperature_c', 60)}°C for optimal deposit",
-                    f"Current efficiency: {props.get('current_efficiency', 0.85)*100:.0f}% - good efficiency at low current density",
-                    "Typical thickness: 1-5µm (2.5µm standard)",
-                    "Requires nickel barrier layer to prevent migration"
-                ],
-                'silver': [
-                    "Highest electrical conductivity of all metals",
-                    "Bright silver solutions for decorative applications",
-                    "Maintain pH between 8.5-9.5 for cyanide-free solutions",
-                    f"Operating temperature: {props.get('temperature_c', 25)}°C (room temperature)",
-                    f"Current efficiency: {props.get('current_efficiency', 0.90)*100:.0f}% - very high efficiency",
-                    "Typical thickness: 5-15µm for functional applications",
-                    "Prone to tarnishing - consider protective topcoat"
-                ]
+                name: list(tips) for name, tips in _metal_specific_tips(metal.key).items()
             }
         }
         
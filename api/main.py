@@ -15,7 +15,7 @@ and provides comprehensive error handling and validation.
 
 import os
 import asyncio
-from typing import Dict, Any
+from typing import Dict, Any, List
 from datetime import datetime
 import logging
 
@@ -23,9 +23,10 @@ import logging
 from dotenv import load_dotenv
 load_dotenv()
 
-from fastapi import FastAPI, File, UploadFile, HTTPException, Depends, BackgroundTasks, Request
+from fastapi import FastAPI, File, UploadFile, HTTPException, Depends, BackgroundTasks, Request, Query
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, JSONResponse, Response
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import FileResponse, JSONResponse, ORJSONResponse, Response
 import uvicorn
 
 from .core import (
@@ -54,7 +55,8 @@ app = FastAPI(
     description="A comprehensive REST API for STL file analysis and manipulation",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
@@ -66,6 +68,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress larger JSON responses (statistics, exports) for clients that accept gzip
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # Initialize session manager
 session_manager = SessionManager()
 
@@ -215,6 +220,20 @@ async def list_sessions():
     return {k: SessionInfo(**v) for k, v in sessions.items() if v is not None}
 
 
+@app.delete("/sessions", response_model=APIResponse)
+async def delete_sessions(ids: List[str] = Query(..., description="Session identifiers to delete")):
+    """Delete several sessions in a single request."""
+    logger.info(f"Deleting sessions", session_count=len(ids))
+    result = session_manager.delete_many(ids)
+    
+    logger.info(f"Sessions deleted", deleted=len(result['deleted']), not_found=len(result['not_found']))
+    return APIResponse(
+        success=True,
+        message=f"Deleted {len(result['deleted'])} sessions",
+        data=result
+    )
+
+
 @app.get("/sessions/{session_id}", response_model=SessionInfo)
 async def get_session_info(session_id: str):
     """Get information about a specific session."""
@@ -5,35 +5,23 @@ This file provides comprehensive tests using pytest to verify the API functional
 Includes unit tests, integration tests, and performance tests.
 """
 
+import io
+
 import pytest
-import asyncio
-import tempfile
-import os
-from pathlib import Path
-from httpx import AsyncClient
-from fastapi.testclient import TestClient
+import pytest_asyncio
+import stl
+from stl import mesh
+from httpx import AsyncClient, ASGITransport
 
 from api.main import app
 from api.core.session_manager import SessionManager
 
 
-@pytest.fixture
-def client():
-    """Create a test client for the FastAPI app."""
-    return TestClient(app)
-
+# Every async test shares the session-scoped client, so they must share its event loop too
+async_session = pytest.mark.asyncio(loop_scope="session")
 
-@pytest.fixture
-async def async_client():
-    """Create an async test client."""
-    async with AsyncClient(app=app, base_url="http://test") as ac:
-        yield ac
 
-
-@pytest.fixture
-def sample_stl_file():
-    """Create a sample STL file for testing."""
-    stl_content = """solid cube
+_ASCII_STL = b"""solid cube
 facet normal 0.0 0.0 1.0
     outer loop
         vertex 0.0 0.0 1.0
@@ -49,79 +37,107 @@ facet normal 0.0 0.0 1.0
     endloop
 endfacet
 endsolid cube"""
-    
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.stl', delete=False) as f:
-        f.write(stl_content)
-        temp_file = f.name
-    
-    yield temp_file
-    os.unlink(temp_file)
 
 
+def _to_binary_stl(ascii_stl: bytes) -> bytes:
+    """Convert ASCII STL content to the equivalent binary STL bytes."""
+    cube = mesh.Mesh.from_file('cube.stl', fh=io.BytesIO(ascii_stl))
+    buffer = io.BytesIO()
+    cube.save('cube.stl', fh=buffer, mode=stl.Mode.BINARY)
+    return buffer.getvalue()
+
+
+# Uploaded as binary so the server can take its frombuffer fast path
+STL_BYTES = _to_binary_stl(_ASCII_STL)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def client():
+    """Create one in-process ASGI client shared by the whole test session."""
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        yield ac
+
+
+async def upload_sample(client, filename='test_cube.stl', content_type='application/octet-stream'):
+    """Upload the sample STL and return the response."""
+    files = {'file': (filename, STL_BYTES, content_type)}
+    return await client.post("/upload", files=files)
+
+
+@async_session
 class TestAPIEndpoints:
     """Test suite for API endpoints."""
     
-    def test_root_endpoint(self, client):
+    async def test_root_endpoint(self, client):
         """Test the root endpoint."""
-        response = client.get("/")
+        response = await client.get("/")
         assert response.status_code == 200
         data = response.json()
         assert data["success"] is True
         assert "version" in data["data"]
     
-    def test_upload_without_file(self, client):
+    async def test_upload_without_file(self, client):
         """Test upload endpoint without a file."""
-        response = client.post("/upload")
+        response = await client.post("/upload")
         assert response.status_code == 422  # Validation error
     
-    def test_upload_invalid_file_type(self, client, sample_stl_file):
+    async def test_upload_invalid_file_type(self, client):
         """Test upload with invalid file type."""
-        with open(sample_stl_file, 'rb') as f:
-            files = {'file': ('test.txt', f, 'text/plain')}
-            response = client.post("/upload", files=files)
+        response = await upload_sample(client, 'test.txt', 'text/plain')
         assert response.status_code == 400
         assert "Only STL files are supported" in response.json()["detail"]
     
-    def test_upload_valid_file(self, client, sample_stl_file):
+    async def test_upload_valid_file(self, client):
         """Test upload with valid STL file."""
-        with open(sample_stl_file, 'rb') as f:
-            files = {'file': ('test_cube.stl', f, 'application/octet-stream')}
-            response = client.post("/upload", files=files)
+        response = await upload_sample(client)
         
         assert response.status_code == 200
         data = response.json()
         assert "session_id" in data
         assert data["filename"] == "test_cube.stl"
     
-    def test_sessions_endpoint(self, client):
+    async def test_sessions_endpoint(self, client):
         """Test sessions endpoint."""
-        response = client.get("/sessions")
+        response = await client.get("/sessions")
         assert response.status_code == 200
         assert isinstance(response.json(), dict)
     
-    def test_invalid_session(self, client):
+    async def test_bulk_delete_sessions(self, client):
+        """Test deleting several sessions in one request."""
+        session_ids = []
+        for _ in range(2):
+            response = await upload_sample(client)
+            session_ids.append(response.json()["session_id"])
+        
+        response = await client.delete("/sessions", params={"ids": session_ids + ["invalid-session-id"]})
+        assert response.status_code == 200
+        data = response.json()
+        assert sorted(data["data"]["deleted"]) == sorted(session_ids)
+        assert data["data"]["not_found"] == ["invalid-session-id"]
+        
+        for session_id in session_ids:
+            assert (await client.get(f"/sessions/{session_id}")).status_code == 404
+    
+    async def test_invalid_session(self, client):
         """Test accessing invalid session."""
-        response = client.get("/sessions/invalid-session-id")
+        response = await client.get("/sessions/invalid-session-id")
         assert response.status_code == 404
     
-    def test_stats_endpoint(self, client):
+    async def test_stats_endpoint(self, client):
         """Test stats endpoint."""
-        response = client.get("/stats")
+        response = await client.get("/stats")
         assert response.status_code == 200
         data = response.json()
         assert "sessions" in data
 
 
+@async_session
 class TestElectroplatingCalculations:
     """Test suite for electroplating calculations."""
     
-    def test_electroplating_parameters(self, client, sample_stl_file):
+    async def test_electroplating_parameters(self, client):
         """Test electroplating parameters calculation."""
-        # First upload a file
-        with open(sample_stl_file, 'rb') as f:
-            files = {'file': ('test_cube.stl', f, 'application/octet-stream')}
-            upload_response = client.post("/upload", files=files)
-        
+        upload_response = await upload_sample(client)
         session_id = upload_response.json()["session_id"]
         
         # Test electroplating calculation
@@ -134,7 +150,7 @@ class TestElectroplatingCalculations:
             "voltage": 6.0
         }
         
-        response = client.post(f"/sessions/{session_id}/electroplating", json=plating_data)
+        response = await client.post(f"/sessions/{session_id}/electroplating", json=plating_data)
         assert response.status_code == 200
         
         data = response.json()
@@ -143,18 +159,14 @@ class TestElectroplatingCalculations:
         assert "plating_parameters" in data
         assert "material_requirements" in data
     
-    def test_electroplating_recommendations(self, client, sample_stl_file):
+    async def test_electroplating_recommendations(self, client):
         """Test electroplating recommendations."""
-        # First upload a file
-        with open(sample_stl_file, 'rb') as f:
-            files = {'file': ('test_cube.stl', f, 'application/octet-stream')}
-            upload_response = client.post("/upload", files=files)
-        
+        upload_response = await upload_sample(client)
         session_id = upload_response.json()["session_id"]
         
         # Test recommendations
         recommendation_data = {"metal_type": "nickel"}
-        response = client.post(f"/sessions/{session_id}/electroplating/recommendations", json=recommendation_data)
+        response = await client.post(f"/sessions/{session_id}/electroplating/recommendations", json=recommendation_data)
         assert response.status_code == 200
         
         data = response.json()
@@ -163,20 +175,17 @@ class TestElectroplatingCalculations:
         assert "metal_specific_tips" in data
 
 
+@async_session
 class TestMeshOperations:
     """Test suite for mesh operations."""
     
-    def test_mesh_analysis(self, client, sample_stl_file):
+    async def test_mesh_analysis(self, client):
         """Test mesh analysis."""
-        # Upload file
-        with open(sample_stl_file, 'rb') as f:
-            files = {'file': ('test_cube.stl', f, 'application/octet-stream')}
-            upload_response = client.post("/upload", files=files)
-        
+        upload_response = await upload_sample(client)
         session_id = upload_response.json()["session_id"]
         
         # Test analysis
-        response = client.get(f"/sessions/{session_id}/analysis")
+        response = await client.get(f"/sessions/{session_id}/analysis")
         assert response.status_code == 200
         
         data = response.json()
@@ -184,17 +193,40 @@ class TestMeshOperations:
         assert "surface_area" in data
         assert "volume" in data
     
-    def test_mesh_validation(self, client, sample_stl_file):
-        """Test mesh validation."""
-        # Upload file
-        with open(sample_stl_file, 'rb') as f:
-            files = {'file': ('test_cube.stl', f, 'application/octet-stream')}
-            upload_response = client.post("/upload", files=files)
+    async def test_analysis_counts_unique_vertices(self, client):
+        """Test that shared vertices are counted once."""
+        upload_response = await upload_sample(client)
+        session_id = upload_response.json()["session_id"]
+        
+        response = await client.get(f"/sessions/{session_id}/analysis")
+        assert response.status_code == 200
+        
+        # Two triangles forming a square share two of their corners
+        data = response.json()
+        assert data["vertex_count"] == 6
+        assert data["unique_vertex_count"] == 4
+    
+    async def test_repeat_upload_reuses_parsed_mesh(self, client):
+        """Test that re-uploading identical content is served from the mesh cache."""
+        hits_before = (await client.get("/stats")).json()["sessions"]["mesh_cache"]["hits"]
         
+        for _ in range(2):
+            response = await upload_sample(client)
+            session_id = response.json()["session_id"]
+            response = await client.get(f"/sessions/{session_id}/analysis")
+            assert response.status_code == 200
+            assert response.json()["triangle_count"] == 2
+        
+        hits_after = (await client.get("/stats")).json()["sessions"]["mesh_cache"]["hits"]
+        assert hits_after > hits_before
+    
+    async def test_mesh_validation(self, client):
+        """Test mesh validation."""
+        upload_response = await upload_sample(client)
         session_id = upload_response.json()["session_id"]
         
         # Test validation
-        response = client.get(f"/sessions/{session_id}/validation")
+        response = await client.get(f"/sessions/{session_id}/validation")
         assert response.status_code == 200
         
         data = response.json()
@@ -202,28 +234,40 @@ class TestMeshOperations:
         assert "issues" in data
         assert "warnings" in data
     
-    def test_mesh_scaling(self, client, sample_stl_file):
+    async def test_mesh_scaling(self, client):
         """Test mesh scaling."""
-        # Upload file
-        with open(sample_stl_file, 'rb') as f:
-            files = {'file': ('test_cube.stl', f, 'application/octet-stream')}
-            upload_response = client.post("/upload", files=files)
-        
+        upload_response = await upload_sample(client)
         session_id = upload_response.json()["session_id"]
         
         # Test scaling
         scale_data = {"scale_factor": 2.0}
-        response = client.post(f"/sessions/{session_id}/scale", json=scale_data)
+        response = await client.post(f"/sessions/{session_id}/scale", json=scale_data)
         assert response.status_code == 200
         
         data = response.json()
         assert data["success"] is True
 
 
+class TestSessionManager:
+    """Test suite for session manager internals."""
+    
+    def test_parse_binary_stl(self):
+        """Test that binary STL content is read directly into mesh records."""
+        data = SessionManager._parse_binary_stl(STL_BYTES)
+        assert data is not None
+        assert len(data) == 2
+        assert data['vectors'][0].tolist() == [[0.0, 0.0, 1.0], [1.0, 0.0, 1.0], [1.0, 1.0, 1.0]]
+    
+    def test_parse_ascii_stl_is_not_binary(self):
+        """Test that ASCII STL content falls back to the regular parser."""
+        assert SessionManager._parse_binary_stl(_ASCII_STL) is None
+
+
+@async_session
 class TestErrorHandling:
     """Test suite for error handling."""
     
-    def test_invalid_session_operations(self, client):
+    async def test_invalid_session_operations(self, client):
         """Test operations on invalid session."""
         invalid_session = "invalid-session-id"
         
@@ -236,16 +280,12 @@ class TestErrorHandling:
         ]
         
         for endpoint in endpoints:
-            response = client.get(endpoint) if "analysis" in endpoint or "validation" in endpoint else client.post(endpoint, json={})
+            response = await client.get(endpoint) if "analysis" in endpoint or "validation" in endpoint else await client.post(endpoint, json={})
             assert response.status_code == 404
     
-    def test_invalid_request_data(self, client, sample_stl_file):
+    async def test_invalid_request_data(self, client):
         """Test invalid request data handling."""
-        # Upload file first
-        with open(sample_stl_file, 'rb') as f:
-            files = {'file': ('test_cube.stl', f, 'application/octet-stream')}
-            upload_response = client.post("/upload", files=files)
-        
+        upload_response = await upload_sample(client)
         session_id = upload_response.json()["session_id"]
         
         # Test invalid electroplating data
@@ -258,7 +298,7 @@ class TestErrorHandling:
             "voltage": 6.0
         }
         
-        response = client.post(f"/sessions/{session_id}/electroplating", json=invalid_data)
+        response = await client.post(f"/sessions/{session_id}/electroplating", json=invalid_data)
         assert response.status_code == 422  # Validation error
 
 
@@ -0,0 +1,229 @@
+"""
+Tests for the STL API clients in api.utils.client_example.
+
+No server is needed: the sync client's session gets a stub transport adapter
+and the async client an httpx.MockTransport.
+"""
+
+import httpx
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import ConnectTimeoutError, ReadTimeoutError
+
+from api.utils.client_example import AsyncSTLAPIClient, STLAPIClient, STLAPIError
+
+
+class _StubAdapter(HTTPAdapter):
+    """Transport adapter that answers each request with the next canned reply."""
+
+    def __init__(self, *replies):
+        super().__init__()
+        self.replies = list(replies)
+        self.sent = []
+
+    def send(self, request, **kwargs):
+        self.sent.append(request)
+        reply = self.replies.pop(0)
+        if isinstance(reply, Exception):
+            raise reply
+
+        status, body = reply
+        response = requests.Response()
+        response.status_code = status
+        response.reason = "Stub"
+        response._content = body
+        response.request = request
+        response.url = request.url
+        return response
+
+
+def stub_client(*replies, **kwargs):
+    """Create a sync client whose requests are answered by a _StubAdapter."""
+    client = STLAPIClient(base_url="http://test", **kwargs)
+    adapter = _StubAdapter(*replies)
+    client.session.mount("http://", adapter)
+    return client, adapter
+
+
+def mock_async_client(handler):
+    """Create an async client whose requests are answered by ``handler``."""
+    client = AsyncSTLAPIClient(base_url="http://test")
+    client._client = httpx.AsyncClient(base_url=client.base_url, transport=httpx.MockTransport(handler))
+    return client
+
+
+class TestRetryPolicy:
+    """Test suite for the sync client's retry adapter."""
+
+    @pytest.fixture
+    def retry(self):
+        return STLAPIClient(max_retries=3).session.get_adapter("http://localhost").max_retries
+
+    def test_adapter_mounted_for_both_schemes(self):
+        """Test that http and https requests go through the same retry adapter."""
+        client = STLAPIClient()
+        assert client.session.get_adapter("http://localhost") is client.session.get_adapter("https://localhost")
+
+    def test_total_follows_max_retries(self):
+        """Test that max_retries sets the retry budget."""
+        assert STLAPIClient(max_retries=5).session.get_adapter("http://localhost").max_retries.total == 5
+
+    @pytest.mark.parametrize("method", ["GET", "HEAD", "OPTIONS", "DELETE"])
+    def test_idempotent_methods_retry_gateway_errors(self, retry, method):
+        """Test that idempotent methods retry 502/503/504 and nothing else."""
+        for status in (502, 503, 504):
+            assert retry.is_retry(method, status)
+        for status in (400, 404, 500):
+            assert not retry.is_retry(method, status)
+
+    @pytest.mark.parametrize("method", ["POST", "PUT", "PATCH"])
+    def test_other_methods_do_not_retry_statuses(self, retry, method):
+        """Test that non-idempotent methods are never retried on a response."""
+        assert not retry.is_retry(method, 503)
+
+    def test_post_retries_connect_errors(self, retry):
+        """Test that POST is retried when the connection was never made."""
+        retried = retry.increment(method="POST", url="/upload", error=ConnectTimeoutError())
+        assert retried.total == retry.total - 1
+
+    def test_post_does_not_retry_read_errors(self, retry):
+        """Test that POST is not resent once the server may have received it."""
+        with pytest.raises(ReadTimeoutError):
+            retry.increment(method="POST", url="/upload", error=ReadTimeoutError(None, "/upload", "read timed out"))
+
+
+class TestMetrics:
+    """Test suite for request metrics and latency percentiles."""
+
+    def test_requests_are_recorded(self):
+        """Test that every request is recorded with its method, URL and status."""
+        client, _ = stub_client((200, b'{}'), (200, b'{"sessions": {}}'))
+        client.list_sessions()
+        client.get_api_stats()
+
+        assert [(m['method'], m['url'], m['status']) for m in client.metrics] == [
+            ('GET', 'http://test/sessions', 200),
+            ('GET', 'http://test/stats', 200),
+        ]
+        assert all(m['latency_s'] >= 0 for m in client.metrics)
+
+    def test_failed_connection_is_recorded(self):
+        """Test that a request that got no response is recorded without a status."""
+        client, _ = stub_client(requests.exceptions.ConnectionError("refused"))
+        with pytest.raises(requests.exceptions.ConnectionError):
+            client.list_sessions()
+
+        assert [m['status'] for m in client.metrics] == [None]
+
+    def test_metrics_size_bounds_history(self):
+        """Test that only the most recent metrics_size requests are kept."""
+        client, _ = stub_client(*[(200, b'{}')] * 3, metrics_size=2)
+        for _ in range(3):
+            client.list_sessions()
+
+        assert len(client.metrics) == 2
+
+    def test_latency_percentiles(self):
+        """Test p50/p95/p99 over a known latency distribution."""
+        client = STLAPIClient()
+        assert client.get_latency_percentiles() == {'p50': None, 'p95': None, 'p99': None}
+
+        # Latencies 0.00-0.99 s, recorded out of order
+        client.metrics.extend({'latency_s': i / 100} for i in reversed(range(100)))
+        assert client.get_latency_percentiles() == pytest.approx({'p50': 0.50, 'p95': 0.95, 'p99': 0.99})
+
+    @pytest.mark.asyncio
+    async def test_async_requests_are_recorded(self):
+        """Test that the async client records metrics the same way."""
+        async with mock_async_client(lambda request: httpx.Response(200, json={})) as client:
+            await client.list_sessions()
+
+        assert [(m['method'], m['url'], m['status']) for m in client.metrics] == [
+            ('GET', 'http://test/sessions', 200),
+        ]
+        assert client.get_latency_percentiles()['p50'] == client.metrics[0]['latency_s']
+
+
+class TestErrors:
+    """Test suite for STLAPIError from both clients."""
+
+    def test_sync_error_carries_detail(self):
+        """Test that an HTTP error is raised as STLAPIError with the decoded body."""
+        client, _ = stub_client((404, b'{"detail": "Session not found"}'))
+        with pytest.raises(STLAPIError) as excinfo:
+            client.get_session_info("missing")
+
+        error = excinfo.value
+        assert error.status_code == 404
+        assert error.detail == "Session not found"
+        assert error.body == {"detail": "Session not found"}
+        assert error.response.status_code == 404
+
+    def test_sync_error_without_json_body(self):
+        """Test that a non-JSON error body falls back to the reason phrase."""
+        client, _ = stub_client((502, b'<html>Bad Gateway</html>'))
+        with pytest.raises(STLAPIError) as excinfo:
+            client.list_sessions()
+
+        assert excinfo.value.status_code == 502
+        assert excinfo.value.detail == "Stub"
+        assert excinfo.value.body is None
+
+    def test_error_is_an_http_error(self):
+        """Test that existing ``except requests.HTTPError`` handlers still catch it."""
+        client, _ = stub_client((400, b'{"detail": "Only STL files are supported"}'))
+        with pytest.raises(requests.HTTPError, match="400 Error: Only STL files are supported"):
+            client.get_api_stats()
+
+    @pytest.mark.asyncio
+    async def test_async_error_carries_detail(self):
+        """Test that the async client raises the same STLAPIError."""
+        reply = httpx.Response(404, json={"detail": "Session not found"})
+        async with mock_async_client(lambda request: reply) as client:
+            with pytest.raises(requests.HTTPError) as excinfo:
+                await client.get_session_info("missing")
+
+        error = excinfo.value
+        assert isinstance(error, STLAPIError)
+        assert error.status_code == 404
+        assert error.detail == "Session not found"
+        assert error.body == {"detail": "Session not found"}
+
+
+class TestMeshInfoCache:
+    """Test suite for the sync client's mesh info cache."""
+
+    INFO = b'{"triangle_count": 12, "bounds": {"min": [0, 0, 0], "max": [1, 1, 1]}}'
+
+    def test_repeat_lookups_are_cached(self):
+        """Test that a second lookup of the same session is served locally."""
+        client, adapter = stub_client((200, self.INFO))
+        assert client.get_mesh_info("abc") == client.get_mesh_info("abc")
+        assert len(adapter.sent) == 1
+
+    @pytest.mark.parametrize("modify", [
+        lambda client: client.scale_mesh("abc", 2.0),
+        lambda client: client.translate_mesh("abc", [1.0, 0.0, 0.0]),
+        lambda client: client.delete_session("abc"),
+        lambda client: client.delete_sessions(["abc"]),
+    ], ids=["scale_mesh", "translate_mesh", "delete_session", "delete_sessions"])
+    def test_modifications_invalidate(self, modify):
+        """Test that changing or deleting a mesh makes the next lookup refetch it."""
+        client, adapter = stub_client((200, self.INFO), (200, b'{"success": true}'), (200, self.INFO))
+        client.get_mesh_info("abc")
+        modify(client)
+        client.get_mesh_info("abc")
+
+        assert len(adapter.sent) == 3
+        assert adapter.sent[-1].path_url == "/sessions/abc/info"
+
+    def test_callers_get_a_copy(self):
+        """Test that mutating a returned dict does not change later lookups."""
+        client, adapter = stub_client((200, self.INFO))
+        info = client.get_mesh_info("abc")
+        info["triangle_count"] = 0
+        info["bounds"]["min"].append(1)
+
+        assert client.get_mesh_info("abc") == {"triangle_count": 12, "bounds": {"min": [0, 0, 0], "max": [1, 1, 1]}}
+        assert len(adapter.sent) == 1
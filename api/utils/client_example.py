@@ -8,14 +8,70 @@ This example shows:
 - Cost estimation
 - Export functionality
 - Error handling and best practices
+- Concurrent requests with the async client
 """
 
+import asyncio
+import atexit
+import copy
+import httpx
 import requests
+import orjson
 import json
 import time
+from collections import deque
+from functools import lru_cache
 from typing import Dict, Any, Optional
 from pathlib import Path
 
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Default headers shared by both clients. Content-Type is set per request by
+# the json= argument, and Accept-Encoding is left to requests/httpx, which
+# advertise every encoding they can decode (gzip, plus br when brotli is installed).
+DEFAULT_HEADERS = {'Accept': 'application/json'}
+
+
+class STLAPIError(requests.exceptions.HTTPError):
+    """
+    HTTP error returned by the STL API.
+    
+    Carries the status code and the decoded JSON error body so callers can
+    inspect the server's ``detail`` message without re-parsing the response.
+    """
+    
+    def __init__(self, status_code: int, detail: str, body: Any = None, response: Any = None):
+        super().__init__(f"{status_code} Error: {detail}", response=response)
+        self.status_code = status_code
+        self.detail = detail
+        self.body = body
+    
+    @classmethod
+    def from_content(cls, status_code: int, content: bytes, reason: str, response: Any = None) -> "STLAPIError":
+        """Build an error from a raw response body."""
+        try:
+            body = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            body = None
+        
+        detail = reason
+        if isinstance(body, dict):
+            detail = body.get('detail') or body.get('message') or reason
+        return cls(status_code, str(detail), body, response)
+
+
+def _latency_percentiles(metrics) -> Dict[str, Optional[float]]:
+    """Get p50/p95/p99 latency in seconds from a client's request metrics."""
+    latencies = sorted(m['latency_s'] for m in metrics)
+    if not latencies:
+        return {'p50': None, 'p95': None, 'p99': None}
+    
+    def percentile(p: float) -> float:
+        return latencies[min(len(latencies) - 1, int(p * len(latencies)))]
+    
+    return {'p50': percentile(0.50), 'p95': percentile(0.95), 'p99': percentile(0.99)}
+
 
 class STLAPIClient:
     """
@@ -29,18 +85,81 @@ class STLAPIClient:
     - Exporting results
     """
     
-    def __init__(self, base_url: str = "http://localhost:8116"):
+    def __init__(self, base_url: str = "http://localhost:8116", max_retries: int = 3, metrics_size: int = 1000):
         """
         Initialize the API client.
         
         Args:
             base_url: Base URL of the STL API
+            max_retries: Number of retries for transient failures (default: 3)
+            metrics_size: Number of recent requests kept in ``metrics`` (default: 1000)
         """
         self.base_url = base_url.rstrip('/')
+        self.max_retries = max_retries
+        self.metrics: deque = deque(maxlen=metrics_size)
         self.session = requests.Session()
-        self.session.headers.update({
-            'Accept': 'application/json'
-        })
+        self.session.headers.update(DEFAULT_HEADERS)
+        
+        # The adapter is the only retry layer. Connection errors are retried for
+        # every method, POST included, since the request never reached the
+        # server; read errors and gateway failures only for idempotent methods.
+        retry = Retry(
+            total=max_retries,
+            backoff_factor=0.1,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset({'GET', 'HEAD', 'OPTIONS', 'DELETE'}),
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(max_retries=retry)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        
+        # Mesh info only changes when the mesh is scaled or translated, so
+        # repeat lookups are served locally until one of those clears it
+        self._cached_mesh_info = lru_cache(maxsize=128)(self._fetch_mesh_info)
+    
+    def close(self) -> None:
+        """Close the underlying HTTP session and its connection pool."""
+        self.session.close()
+    
+    def _send(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send a request and record its latency and status in ``self.metrics``."""
+        start = time.perf_counter()
+        status = None
+        try:
+            response = self.session.request(method, url, **kwargs)
+            status = response.status_code
+            return response
+        finally:
+            self.metrics.append({
+                'method': method,
+                'url': url,
+                'status': status,
+                'latency_s': time.perf_counter() - start
+            })
+    
+    def _raise_for_status(self, response: requests.Response) -> None:
+        """Raise STLAPIError if the response is an HTTP error."""
+        if not response.ok:
+            raise STLAPIError.from_content(response.status_code, response.content, response.reason, response)
+    
+    def _request(self, method: str, path: str, **kwargs) -> Dict[str, Any]:
+        """
+        Send a request to the API and return the decoded JSON body.
+        
+        Retries are handled by the session adapter; see ``__init__``.
+        
+        Raises:
+            STLAPIError: If the API returns an HTTP error
+        """
+        url = f"{self.base_url}{path}"
+        response = self._send(method, url, **kwargs)
+        self._raise_for_status(response)
+        return orjson.loads(response.content)
+    
+    def get_latency_percentiles(self) -> Dict[str, Optional[float]]:
+        """Get p50/p95/p99 request latency in seconds over the recorded metrics."""
+        return _latency_percentiles(self.metrics)
     
     def upload_file(self, file_path: str) -> Dict[str, Any]:
         """
@@ -58,62 +177,62 @@ class STLAPIClient:
         if not file_path.lower().endswith('.stl'):
             raise ValueError("Only STL files are supported")
         
+        # Read the content up front so a retried upload resends the full file
         with open(file_path, 'rb') as f:
-            files = {'file': (Path(file_path).name, f, 'application/octet-stream')}
-            response = self.session.post(f"{self.base_url}/upload", files=files)
+            content = f.read()
         
-        response.raise_for_status()
-        return response.json()
+        files = {'file': (Path(file_path).name, content, 'application/octet-stream')}
+        return self._request('POST', "/upload", files=files)
     
     def get_session_info(self, session_id: str) -> Dict[str, Any]:
         """Get information about a session."""
-        response = self.session.get(f"{self.base_url}/sessions/{session_id}")
-        response.raise_for_status()
-        return response.json()
+        return self._request('GET', f"/sessions/{session_id}")
     
     def list_sessions(self) -> Dict[str, Any]:
         """List all active sessions."""
-        response = self.session.get(f"{self.base_url}/sessions")
-        response.raise_for_status()
-        return response.json()
+        return self._request('GET', "/sessions")
     
     def delete_session(self, session_id: str) -> Dict[str, Any]:
         """Delete a session."""
-        response = self.session.delete(f"{self.base_url}/sessions/{session_id}")
-        response.raise_for_status()
-        return response.json()
+        self._cached_mesh_info.cache_clear()
+        return self._request('DELETE', f"/sessions/{session_id}")
+    
+    def delete_sessions(self, session_ids: list) -> Dict[str, Any]:
+        """Delete several sessions in a single request."""
+        self._cached_mesh_info.cache_clear()
+        return self._request('DELETE', "/sessions", params={'ids': session_ids})
+    
+    def _fetch_mesh_info(self, session_id: str) -> Dict[str, Any]:
+        """Fetch basic mesh information, bypassing the cache."""
+        return self._request('GET', f"/sessions/{session_id}/info")
     
     def get_mesh_info(self, session_id: str) -> Dict[str, Any]:
-        """Get basic mesh information."""
-        response = self.session.get(f"{self.base_url}/sessions/{session_id}/info")
-        response.raise_for_status()
-        return response.json()
+        """
+        Get basic mesh information (cached until the mesh is modified).
+        
+        Returns a copy, so callers can't change what later lookups see.
+        """
+        return copy.deepcopy(self._cached_mesh_info(session_id))
     
     def get_mesh_statistics(self, session_id: str) -> Dict[str, Any]:
         """Get comprehensive mesh statistics."""
-        response = self.session.get(f"{self.base_url}/sessions/{session_id}/analysis")
-        response.raise_for_status()
-        return response.json()
+        return self._request('GET', f"/sessions/{session_id}/analysis")
     
     def validate_mesh(self, session_id: str) -> Dict[str, Any]:
         """Validate the mesh for issues."""
-        response = self.session.get(f"{self.base_url}/sessions/{session_id}/validation")
-        response.raise_for_status()
-        return response.json()
+        return self._request('GET', f"/sessions/{session_id}/validation")
     
     def scale_mesh(self, session_id: str, scale_factor: float) -> Dict[str, Any]:
         """Scale the mesh by a factor."""
         data = {"scale_factor": scale_factor}
-        response = self.session.post(f"{self.base_url}/sessions/{session_id}/scale", json=data, headers={"Content-Type": "application/json"})
-        response.raise_for_status()
-        return response.json()
+        self._cached_mesh_info.cache_clear()
+        return self._request('POST', f"/sessions/{session_id}/scale", json=data)
     
     def translate_mesh(self, session_id: str, translation: list) -> Dict[str, Any]:
         """Translate the mesh by a vector."""
         data = {"translation": translation}
-        response = self.session.post(f"{self.base_url}/sessions/{session_id}/translate", json=data, headers={"Content-Type": "application/json"})
-        response.raise_for_status()
-        return response.json()
+        self._cached_mesh_info.cache_clear()
+        return self._request('POST', f"/sessions/{session_id}/translate", json=data)
     
     def estimate_cost(self, session_id: str, resin_density: float, resin_price: float, volume_unit: str = "mm3") -> Dict[str, Any]:
         """Estimate resin cost for printing."""
@@ -122,45 +241,205 @@ class STLAPIClient:
             "resin_price_per_kg": resin_price,
             "volume_unit": volume_unit
         }
-        response = self.session.post(f"{self.base_url}/sessions/{session_id}/cost", json=data, headers={"Content-Type": "application/json"})
-        response.raise_for_status()
-        return response.json()
+        return self._request('POST', f"/sessions/{session_id}/cost", json=data)
     
     def export_statistics(self, session_id: str, format: str = "json", output_path: Optional[str] = None) -> str:
         """Export mesh statistics to a file."""
         data = {"format": format}
-        response = self.session.post(f"{self.base_url}/sessions/{session_id}/export", json=data, headers={"Content-Type": "application/json"})
-        response.raise_for_status()
+        # Save to default location unless a path is given
+        filename = output_path or f"mesh_statistics.{format}"
         
-        if output_path:
-            with open(output_path, 'wb') as f:
-                f.write(response.content)
-            return output_path
-        else:
-            # Save to default location
-            filename = f"mesh_statistics.{format}"
+        # Stream the body straight to disk instead of buffering it in memory
+        with self._send('POST', f"{self.base_url}/sessions/{session_id}/export", json=data, stream=True) as response:
+            self._raise_for_status(response)
             with open(filename, 'wb') as f:
-                f.write(response.content)
-            return filename
+                for chunk in response.iter_content(chunk_size=1 << 16):
+                    f.write(chunk)
+        
+        return filename
     
     def get_convex_hull_volume(self, session_id: str) -> Dict[str, Any]:
         """Get convex hull volume (requires scipy)."""
-        response = self.session.get(f"{self.base_url}/sessions/{session_id}/convex-hull-volume")
-        response.raise_for_status()
-        return response.json()
+        return self._request('GET', f"/sessions/{session_id}/convex-hull-volume")
     
     def get_api_stats(self) -> Dict[str, Any]:
         """Get API statistics."""
-        response = self.session.get(f"{self.base_url}/stats")
-        response.raise_for_status()
-        return response.json()
+        return self._request('GET', "/stats")
+
+
+_client: Optional[STLAPIClient] = None
+
+
+def get_client() -> STLAPIClient:
+    """
+    Get the shared module-level client, creating it on first use.
+    
+    Reusing one client keeps its connection pool alive across calls instead
+    of rebuilding it every time an example runs.
+    """
+    global _client
+    _client = _client or STLAPIClient()
+    return _client
+
+
+@atexit.register
+def close_client() -> None:
+    """Close the shared client, if one was created."""
+    global _client
+    if _client is not None:
+        _client.close()
+        _client = None
+
+
+class AsyncSTLAPIClient:
+    """
+    Async client for the STL Analysis API.
+    
+    Mirrors STLAPIClient on top of httpx.AsyncClient so that independent
+    requests can be issued concurrently with asyncio.gather. Every endpoint
+    method of the sync client has an async counterpart; mesh info is not
+    cached, since concurrent callers could otherwise see a stale entry while
+    a scale or translate is in flight.
+    """
+    
+    def __init__(self, base_url: str = "http://localhost:8116", max_retries: int = 3, metrics_size: int = 1000):
+        """
+        Initialize the async API client.
+        
+        Args:
+            base_url: Base URL of the STL API
+            max_retries: Number of connection retries per request (default: 3)
+            metrics_size: Number of recent requests kept in ``metrics`` (default: 1000)
+        """
+        self.base_url = base_url.rstrip('/')
+        self.metrics: deque = deque(maxlen=metrics_size)
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            headers=DEFAULT_HEADERS,
+            transport=httpx.AsyncHTTPTransport(retries=max_retries)
+        )
+    
+    async def __aenter__(self) -> "AsyncSTLAPIClient":
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+    
+    async def aclose(self) -> None:
+        """Close the underlying connection pool."""
+        await self._client.aclose()
+    
+    async def _send(self, method: str, path: str, **kwargs) -> httpx.Response:
+        """Send a request and record its latency and status in ``self.metrics``."""
+        start = time.perf_counter()
+        status = None
+        try:
+            response = await self._client.request(method, path, **kwargs)
+            status = response.status_code
+            return response
+        finally:
+            self.metrics.append({
+                'method': method,
+                'url': f"{self.base_url}{path}",
+                'status': status,
+                'latency_s': time.perf_counter() - start
+            })
+    
+    async def _request(self, method: str, path: str, **kwargs) -> Dict[str, Any]:
+        """Send a request and return the decoded JSON body."""
+        response = await self._send(method, path, **kwargs)
+        if response.is_error:
+            raise STLAPIError.from_content(response.status_code, response.content, response.reason_phrase)
+        return orjson.loads(response.content)
+    
+    def get_latency_percentiles(self) -> Dict[str, Optional[float]]:
+        """Get p50/p95/p99 request latency in seconds over the recorded metrics."""
+        return _latency_percentiles(self.metrics)
+    
+    async def upload_file(self, file_path: str) -> Dict[str, Any]:
+        """Upload an STL file and create a session."""
+        if not Path(file_path).exists():
+            raise FileNotFoundError(f"File not found: {file_path}")
+        
+        if not file_path.lower().endswith('.stl'):
+            raise ValueError("Only STL files are supported")
+        
+        with open(file_path, 'rb') as f:
+            content = f.read()
+        
+        files = {'file': (Path(file_path).name, content, 'application/octet-stream')}
+        return await self._request('POST', "/upload", files=files)
+    
+    async def get_session_info(self, session_id: str) -> Dict[str, Any]:
+        """Get information about a session."""
+        return await self._request('GET', f"/sessions/{session_id}")
+    
+    async def list_sessions(self) -> Dict[str, Any]:
+        """List all active sessions."""
+        return await self._request('GET', "/sessions")
+    
+    async def delete_session(self, session_id: str) -> Dict[str, Any]:
+        """Delete a session."""
+        return await self._request('DELETE', f"/sessions/{session_id}")
+    
+    async def delete_sessions(self, session_ids: list) -> Dict[str, Any]:
+        """Delete several sessions in a single request."""
+        return await self._request('DELETE', "/sessions", params={'ids': session_ids})
+    
+    async def get_mesh_info(self, session_id: str) -> Dict[str, Any]:
+        """Get basic mesh information."""
+        return await self._request('GET', f"/sessions/{session_id}/info")
+    
+    async def get_mesh_statistics(self, session_id: str) -> Dict[str, Any]:
+        """Get comprehensive mesh statistics."""
+        return await self._request('GET', f"/sessions/{session_id}/analysis")
+    
+    async def validate_mesh(self, session_id: str) -> Dict[str, Any]:
+        """Validate the mesh for issues."""
+        return await self._request('GET', f"/sessions/{session_id}/validation")
+    
+    async def scale_mesh(self, session_id: str, scale_factor: float) -> Dict[str, Any]:
+        """Scale the mesh by a factor."""
+        return await self._request('POST', f"/sessions/{session_id}/scale", json={"scale_factor": scale_factor})
+    
+    async def translate_mesh(self, session_id: str, translation: list) -> Dict[str, Any]:
+        """Translate the mesh by a vector."""
+        return await self._request('POST', f"/sessions/{session_id}/translate", json={"translation": translation})
+    
+    async def estimate_cost(self, session_id: str, resin_density: float, resin_price: float, volume_unit: str = "mm3") -> Dict[str, Any]:
+        """Estimate resin cost for printing."""
+        data = {
+            "resin_density_g_cm3": resin_density,
+            "resin_price_per_kg": resin_price,
+            "volume_unit": volume_unit
+        }
+        return await self._request('POST', f"/sessions/{session_id}/cost", json=data)
+    
+    async def export_statistics(self, session_id: str, format: str = "json", output_path: Optional[str] = None) -> str:
+        """Export mesh statistics to a file, streaming the body to disk."""
+        filename = output_path or f"mesh_statistics.{format}"
+        async with self._client.stream('POST', f"/sessions/{session_id}/export", json={"format": format}) as response:
+            if response.is_error:
+                content = await response.aread()
+                raise STLAPIError.from_content(response.status_code, content, response.reason_phrase)
+            with open(filename, 'wb') as f:
+                async for chunk in response.aiter_bytes(1 << 16):
+                    f.write(chunk)
+        return filename
+    
+    async def get_convex_hull_volume(self, session_id: str) -> Dict[str, Any]:
+        """Get convex hull volume (requires scipy)."""
+        return await self._request('GET', f"/sessions/{session_id}/convex-hull-volume")
+    
+    async def get_api_stats(self) -> Dict[str, Any]:
+        """Get API statistics."""
+        return await self._request('GET', "/stats")
 
 
 def example_usage():
     """Example usage of the STL API client."""
     
-    # Initialize client
-    client = STLAPIClient("http://localhost:8116")
+    client = get_client()
     
     try:
         print("=== STL API Client Example ===\n")
@@ -211,7 +490,7 @@ def example_usage():
         print("\n5. Getting comprehensive statistics...")
         stats = client.get_mesh_statistics(session_id)
         print(f"✓ Statistics retrieved")
-        print(f"  Vertex count: {stats['vertex_count']:,}")
+        print(f"  Vertex count: {stats['vertex_count']:,} ({stats['unique_vertex_count']:,} unique)")
         print(f"  Aspect ratio: {stats['aspect_ratio']:.3f}")
         print(f"  SA/V ratio: {stats['surface_area_to_volume_ratio']:.3f}")
         print(f"  Triangle areas - Min: {stats['triangle_areas']['min']:.6f}, Max: {stats['triangle_areas']['max']:.6f}")
@@ -268,13 +547,13 @@ def example_usage():
         print("\n11. Getting API statistics...")
         api_stats = client.get_api_stats()
         print(f"✓ API stats retrieved")
-        print(f"  Total sessions: {api_stats['sessions']['total_sessions']}")
-        print(f"  Cached instances: {api_stats['sessions']['cached_instances']}")
+        print(f"  Total sessions: {api_stats['sessions']['sessions']['total_sessions']}")
+        print(f"  Cached instances: {api_stats['sessions']['cache']['stl_instances_cached']}")
         
         # Clean up - delete session
         print("\n12. Cleaning up...")
-        delete_result = client.delete_session(session_id)
-        print(f"✓ Session deleted: {delete_result['message']}")
+        delete_result = client.delete_sessions([session_id])
+        print(f"✓ Sessions deleted: {delete_result['message']}")
         
         print("\n=== Example completed successfully! ===")
         
@@ -287,7 +566,7 @@ def example_usage():
 def advanced_usage_example():
     """Advanced usage example with mesh manipulation."""
     
-    client = STLAPIClient("http://localhost:8116")
+    client = get_client()
     
     try:
         print("=== Advanced Usage Example ===\n")
@@ -321,13 +600,63 @@ def advanced_usage_example():
         print(f"Final center of mass: {final_info['center_of_mass']}")
         
         # Clean up
-        client.delete_session(session_id)
+        client.delete_sessions([session_id])
         print("\n✓ Session cleaned up")
         
     except Exception as e:
         print(f"✗ Advanced example failed: {e}")
 
 
+async def example_usage_async():
+    """Example usage of the async client, fetching independent data concurrently."""
+    
+    async with AsyncSTLAPIClient("http://localhost:8116") as client:
+        try:
+            print("=== Async STL API Client Example ===\n")
+            
+            upload_result = await client.upload_file("sample.stl")
+            session_id = upload_result['session_id']
+            print(f"✓ File uploaded: {upload_result['filename']}")
+            
+            # These reads are independent, so total latency is the slowest
+            # request rather than the sum of all of them
+            info, mesh_info, stats, validation, cost, api_stats, sessions = await asyncio.gather(
+                client.get_session_info(session_id),
+                client.get_mesh_info(session_id),
+                client.get_mesh_statistics(session_id),
+                client.validate_mesh(session_id),
+                client.estimate_cost(session_id, resin_density=1.1, resin_price=50.0),
+                client.get_api_stats(),
+                client.list_sessions()
+            )
+            print(f"✓ Upload time: {info['upload_time']}")
+            print(f"✓ Triangle count: {mesh_info['triangle_count']:,}")
+            print(f"✓ Aspect ratio: {stats['aspect_ratio']:.3f}")
+            print(f"✓ Is valid: {validation['is_valid']}")
+            print(f"✓ Estimated resin cost: ${cost['cost']:.2f}")
+            print(f"✓ Total sessions: {api_stats['sessions']['sessions']['total_sessions']}")
+            print(f"✓ Found {len(sessions)} active sessions")
+            
+            # Mutations depend on each other and stay sequential
+            await client.scale_mesh(session_id, 2.0)
+            await client.translate_mesh(session_id, [10, 5, 0])
+            final_info = await client.get_mesh_info(session_id)
+            print(f"✓ Final center of mass: {final_info['center_of_mass']}")
+            
+            await client.delete_session(session_id)
+            print("\n✓ Session cleaned up")
+            
+            latency = client.get_latency_percentiles()
+            print(f"✓ Latency p50/p95: {latency['p50'] * 1000:.1f} / {latency['p95'] * 1000:.1f} ms")
+            
+        except FileNotFoundError:
+            print("✗ Sample STL file not found. Please provide a valid STL file path.")
+        except httpx.ConnectError:
+            print("✗ Could not connect to the API. Make sure it's running on http://localhost:8116")
+        except Exception as e:
+            print(f"✗ Async example failed: {e}")
+
+
 if __name__ == "__main__":
     # Run basic example
     example_usage()
@@ -335,4 +664,9 @@ if __name__ == "__main__":
     print("\n" + "="*50 + "\n")
     
     # Run advanced example
-    advanced_usage_example() 
\ No newline at end of file
+    advanced_usage_example()
+    
+    print("\n" + "="*50 + "\n")
+    
+    # Run async example
+    asyncio.run(example_usage_async())
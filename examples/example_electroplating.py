@@ -6,30 +6,87 @@ This script demonstrates the comprehensive electroplating calculation features
 added to the STL Analysis API. It shows how to calculate electroplating parameters
 for different metals and scenarios.
 
-Usage:
-    python example_electroplating.py
+Usage (from the repository root):
+    python -m examples.example_electroplating
 """
 
 import sys
-import os
-sys.path.append(os.path.join(os.path.dirname(__file__), 'api'))
 
-from api.core.stl_tools import STLTools
+import numpy as np
+from stl import mesh
 
-def example_basic_electroplating():
+from api.core.metals import METALS, Metal
+from api.core.stl_tools import STLTools, sweep_plating
+
+# Hypothetical surface area used where no STL file is loaded
+SURFACE_AREA_MM2 = 5000  # 50 cm²
+
+
+def _demo_part() -> mesh.Mesh:
+    """
+    Build a cube whose surface area is SURFACE_AREA_MM2.
+    
+    Stands in for a loaded STL file so the mesh-based calculators have
+    something to measure.
+    """
+    side = (SURFACE_AREA_MM2 / 6) ** 0.5
+    corners = np.array([
+        [0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0],
+        [0, 0, 1], [1, 0, 1], [1, 1, 1], [0, 1, 1]
+    ], dtype=np.float32) * side
+    faces = np.array([
+        [0, 3, 1], [1, 3, 2], [0, 4, 7], [0, 7, 3], [1, 2, 6], [1, 6, 5],
+        [2, 3, 7], [2, 7, 6], [0, 1, 5], [0, 5, 4], [4, 5, 6], [4, 6, 7]
+    ])
+    part = mesh.Mesh(np.zeros(len(faces), dtype=mesh.Mesh.dtype), calculate_normals=False)
+    part.vectors[:] = corners[faces]
+    return part
+
+
+def _sweep_or_raise(area_mm2: float, **params) -> np.ndarray:
+    """
+    Validate sweep inputs once up front, then compute the whole sweep.
+    
+    Args:
+        area_mm2: Surface area in mm²
+        **params: Arrays or scalars passed on to sweep_plating
+        
+    Returns:
+        Structured array from sweep_plating
+        
+    Raises:
+        ValueError: If any input is not positive or an efficiency exceeds 1
+    """
+    for name, value in {'area_mm2': area_mm2, **params}.items():
+        if not np.all(np.asarray(value) > 0):
+            raise ValueError(f"{name} must be positive")
+    if np.any(np.asarray(params.get('efficiency', 1.0)) > 1):
+        raise ValueError("efficiency must not exceed 1")
+    return sweep_plating(area_mm2, **params)
+
+
+def _print_rows(table: np.ndarray, fmt: str) -> None:
+    """
+    Print the rows of a 2-D numeric table with a printf-style row format.
+    
+    Small tables are joined in Python; longer ones are handed to np.savetxt
+    in a single call.
+    """
+    if len(table) > 5:
+        np.savetxt(sys.stdout, table, fmt=fmt)
+    else:
+        print("\n".join(fmt % tuple(row) for row in table))
+
+
+def example_basic_electroplating(stl_tools: STLTools):
     """Example: Basic electroplating calculations for a sample part."""
     print("\n=== Example 1: Basic Electroplating Calculations ===")
     
-    stl_tools = STLTools()
-    
-    # For demonstration, we'll use a hypothetical surface area
+    # For demonstration the loaded mesh is a generated cube with a known area
     # In practice, you would load an actual STL file
-    print("Note: Using hypothetical surface area for demonstration")
-    surface_area_mm2 = 5000  # 50 cm²
-    
-    # Create a mock mesh with the desired surface area
-    # This is just for demonstration - in real usage you'd load an STL file
-    print(f"Surface area: {surface_area_mm2} mm² ({surface_area_mm2/100:.1f} cm²)")
+    print("Note: Using a generated cube for demonstration")
+    surface_area_mm2 = stl_tools.calculate_surface_area()
+    print(f"Surface area: {surface_area_mm2:.0f} mm² ({surface_area_mm2/100:.1f} cm²)")
     
     # Calculate basic electroplating parameters
     plating_params = stl_tools.calculate_electroplating_parameters(
@@ -56,86 +113,85 @@ def example_metal_comparison():
     """Example: Compare different plating metals."""
     print("\n=== Example 2: Metal Comparison ===")
     
-    stl_tools = STLTools()
-    
-    metals = ['nickel', 'copper', 'chrome', 'gold', 'silver']
+    # METALS holds one array per property, so every metal is computed in the same pass
+    metals = list(Metal)
+    try:
+        sweep = _sweep_or_raise(
+            SURFACE_AREA_MM2,
+            thickness_um=METALS['thickness_um'],
+            cd=(METALS['cd_min'] + METALS['cd_max']) / 2,
+            density=METALS['density'],
+            voltage=METALS['voltage'],
+            efficiency=METALS['efficiency']
+        )
+    except ValueError as e:
+        print(f"Error: {e}")
+        return
     
-    print("Comparing different plating metals for the same part:")
+    print(f"Comparing different plating metals for a {SURFACE_AREA_MM2} mm² part:")
     print(f"{'Metal':<10} {'Current (A)':<12} {'Time (min)':<12} {'Mass (g)':<10} {'Cost ($)':<10}")
     print("-" * 60)
     
-    for metal in metals:
-        try:
-            recommendations = stl_tools.get_electroplating_recommendations(metal)
-            params = recommendations['calculated_parameters']
-            
-            print(f"{metal:<10} {params['current_requirements']['recommended_amps']:<12.2f} "
-                  f"{params['plating_parameters']['plating_time_minutes']:<12.1f} "
-                  f"{params['material_requirements']['metal_mass_g']:<10.2f} "
-                  f"{params['cost_estimates']['total_cost']:<10.2f}")
-        except Exception as e:
-            print(f"{metal:<10} Error: {e}")
+    rows = [f"{metal.key:<10} {amps:<12.2f} {time:<12.1f} {grams:<10.2f} {dollars:<10.2f}"
+            for metal, amps, time, grams, dollars in zip(metals, sweep['current_a'], sweep['time_min'],
+                                                         sweep['mass_g'], sweep['cost_total'])]
+    print("\n".join(rows))
 
 
-def example_thickness_variation():
+def example_thickness_variation(stl_tools: STLTools):
     """Example: How plating thickness affects parameters."""
     print("\n=== Example 3: Thickness Variation ===")
     
-    stl_tools = STLTools()
+    thicknesses = np.array([5, 10, 25, 50, 100])  # microns
     
-    thicknesses = [5, 10, 25, 50, 100]  # microns
+    # Default copper parameters of calculate_electroplating_parameters; everything
+    # that does not depend on thickness is computed once in the context
+    try:
+        context = stl_tools.prepare_plating_context(
+            metal=Metal.COPPER, current_density=0.085, voltage=3.0, efficiency=0.95,
+            surface_area_mm2=SURFACE_AREA_MM2
+        )
+        results = context.for_thickness(thicknesses)
+    except ValueError as e:
+        print(f"Error: {e}")
+        return
     
     print("Effect of plating thickness on parameters:")
     print(f"{'Thickness (μm)':<15} {'Time (min)':<12} {'Mass (g)':<10} {'Cost ($)':<10}")
     print("-" * 50)
     
-    for thickness in thicknesses:
-        try:
-            plating_params = stl_tools.calculate_electroplating_parameters(
-                plating_thickness_microns=thickness
-            )
-            
-            print(f"{thickness:<15} {plating_params['plating_parameters']['plating_time_minutes']:<12.1f} "
-                  f"{plating_params['material_requirements']['metal_mass_g']:<10.2f} "
-                  f"{plating_params['cost_estimates']['total_cost']:<10.2f}")
-        except Exception as e:
-            print(f"{thickness:<15} Error: {e}")
+    table = np.column_stack((thicknesses, results['plating_time_minutes'],
+                             results['metal_mass_g'], results['total_cost']))
+    _print_rows(table, "%-15g %-12.1f %-10.2f %-10.2f")
 
 
 def example_current_density_optimization():
     """Example: Optimizing current density for best results."""
     print("\n=== Example 4: Current Density Optimization ===")
     
-    stl_tools = STLTools()
+    current_densities = np.array([0.05, 0.07, 0.1, 0.15, 0.2])  # A/in²
     
-    current_densities = [0.05, 0.07, 0.1, 0.15, 0.2]  # A/in²
+    # Each setting runs over a current_density..current_density+0.02 range; sweep its midpoint
+    try:
+        sweep = _sweep_or_raise(SURFACE_AREA_MM2, cd=current_densities + 0.01)
+    except ValueError as e:
+        print(f"Error: {e}")
+        return
     
-    print("Effect of current density on plating time and quality:")
-    print(f"{'Current Density':<15} {'Time (min)':<12} {'Coverage %':<12} {'Surface Factor':<15}")
-    print("-" * 60)
+    print("Effect of current density on plating time and energy:")
+    print(f"{'Current Density':<15} {'Current (A)':<12} {'Time (min)':<12} {'Energy (Wh)':<12}")
+    print("-" * 55)
     
-    for current_density in current_densities:
-        try:
-            plating_params = stl_tools.calculate_electroplating_parameters(
-                current_density_min=current_density,
-                current_density_max=current_density + 0.02
-            )
-            
-            print(f"{current_density:<15.2f} {plating_params['plating_parameters']['plating_time_minutes']:<12.1f} "
-                  f"{plating_params['quality_factors']['coverage_efficiency']*100:<12.1f} "
-                  f"{plating_params['quality_factors']['surface_roughness_factor']:<15.2f}")
-        except Exception as e:
-            print(f"{current_density:<15.2f} Error: {e}")
+    table = np.column_stack((current_densities, sweep['current_a'], sweep['time_min'], sweep['energy_wh']))
+    _print_rows(table, "%-15.2f %-12.2f %-12.1f %-12.1f")
 
 
-def example_nickel_recommendations():
+def example_nickel_recommendations(stl_tools: STLTools):
     """Example: Detailed nickel plating recommendations."""
     print("\n=== Example 5: Nickel Plating Recommendations ===")
     
-    stl_tools = STLTools()
-    
     try:
-        recommendations = stl_tools.get_electroplating_recommendations('nickel')
+        recommendations = stl_tools.get_electroplating_recommendations(Metal.NICKEL)
         
         print("Nickel Plating Properties:")
         props = recommendations['metal_properties']
@@ -164,41 +220,39 @@ def example_cost_analysis():
     """Example: Detailed cost breakdown for different scenarios."""
     print("\n=== Example 6: Cost Analysis ===")
     
-    stl_tools = STLTools()
-    
     scenarios = [
-        {"name": "Thin Nickel", "thickness": 10, "metal": "nickel"},
-        {"name": "Standard Nickel", "thickness": 25, "metal": "nickel"},
-        {"name": "Thick Nickel", "thickness": 50, "metal": "nickel"},
-        {"name": "Gold Flash", "thickness": 5, "metal": "gold"},
-        {"name": "Copper Base", "thickness": 80, "metal": "copper"},
+        {"name": "Thin Nickel", "thickness": 10, "metal": Metal.NICKEL},
+        {"name": "Standard Nickel", "thickness": 25, "metal": Metal.NICKEL},
+        {"name": "Thick Nickel", "thickness": 50, "metal": Metal.NICKEL},
+        {"name": "Gold Flash", "thickness": 5, "metal": Metal.GOLD},
+        {"name": "Copper Base", "thickness": 80, "metal": Metal.COPPER},
     ]
     
+    # Nickel scenarios use the calculator defaults; the rest read density and
+    # voltage straight from their metal's row in the table
+    rows = METALS[[s['metal'] for s in scenarios]]
+    is_nickel = np.array([s['metal'] is Metal.NICKEL for s in scenarios])
+    
+    try:
+        sweep = _sweep_or_raise(
+            SURFACE_AREA_MM2,
+            thickness_um=np.array([s['thickness'] for s in scenarios]),
+            density=np.where(is_nickel, 8.96, rows['density']),
+            voltage=np.where(is_nickel, 3.0, rows['voltage'])
+        )
+    except ValueError as e:
+        print(f"Error: {e}")
+        return
+    
     print("Cost comparison for different plating scenarios:")
     print(f"{'Scenario':<15} {'Thickness':<12} {'Metal':<10} {'Material Cost':<15} {'Electricity':<15} {'Total':<10}")
     print("-" * 80)
     
-    for scenario in scenarios:
-        try:
-            if scenario['metal'] == 'nickel':
-                plating_params = stl_tools.calculate_electroplating_parameters(
-                    plating_thickness_microns=scenario['thickness']
-                )
-            else:
-                recommendations = stl_tools.get_electroplating_recommendations(scenario['metal'])
-                # Override thickness
-                plating_params = stl_tools.calculate_electroplating_parameters(
-                    plating_thickness_microns=scenario['thickness'],
-                    metal_density_g_cm3=recommendations['metal_properties']['density_g_cm3'],
-                    voltage=recommendations['metal_properties']['voltage']
-                )
-            
-            print(f"{scenario['name']:<15} {scenario['thickness']:<12} {scenario['metal']:<10} "
-                  f"${plating_params['cost_estimates']['solution_cost']:<15.2f} "
-                  f"${plating_params['cost_estimates']['electricity_cost']:<15.2f} "
-                  f"${plating_params['cost_estimates']['total_cost']:<10.2f}")
-        except Exception as e:
-            print(f"{scenario['name']:<15} Error: {e}")
+    rows = [f"{scenario['name']:<15} {scenario['thickness']:<12} {scenario['metal'].key:<10} "
+            f"${solution:<15.2f} ${electricity:<15.2f} ${total:<10.2f}"
+            for scenario, solution, electricity, total in zip(scenarios, sweep['solution_cost'],
+                                                              sweep['electricity_cost'], sweep['cost_total'])]
+    print("\n".join(rows))
 
 
 def main():
@@ -206,29 +260,43 @@ def main():
     print("Electroplating Calculation Examples")
     print("=" * 50)
     
-    try:
-        example_basic_electroplating()
-        example_metal_comparison()
-        example_thickness_variation()
-        example_current_density_optimization()
-        example_nickel_recommendations()
-        example_cost_analysis()
-        
-        print("\n" + "=" * 50)
-        print("All examples completed successfully!")
-        print("\nKey Features Demonstrated:")
-        print("• Current density calculation (0.07-0.1 A/in² range)")
-        print("• Plating time estimation based on thickness and current")
-        print("• Material requirements calculation")
-        print("• Power and energy consumption")
-        print("• Cost estimation (electricity + solution)")
-        print("• Quality factors (coverage efficiency, surface roughness)")
-        print("• Metal-specific recommendations")
-        print("• Surface preparation and process tips")
-        
-    except Exception as e:
-        print(f"Error running examples: {e}")
+    # One instance is shared by every example that needs the calculator
+    stl_tools = STLTools()
+    stl_tools.load_mesh(_demo_part())
+    
+    examples = [
+        lambda: example_basic_electroplating(stl_tools),
+        example_metal_comparison,
+        lambda: example_thickness_variation(stl_tools),
+        example_current_density_optimization,
+        lambda: example_nickel_recommendations(stl_tools),
+        example_cost_analysis,
+    ]
+    
+    # A failing example is reported and the rest still run
+    failed = 0
+    for example in examples:
+        try:
+            example()
+        except Exception as e:
+            print(f"Error running example: {e}")
+            failed += 1
+    
+    print("\n" + "=" * 50)
+    if failed:
+        print(f"{failed} of {len(examples)} examples failed")
         sys.exit(1)
+    
+    print("All examples completed successfully!")
+    print("\nKey Features Demonstrated:")
+    print("• Current density calculation (0.07-0.1 A/in² range)")
+    print("• Plating time estimation based on thickness and current")
+    print("• Material requirements calculation")
+    print("• Power and energy consumption")
+    print("• Cost estimation (electricity + solution)")
+    print("• Quality factors (coverage efficiency, surface roughness)")
+    print("• Metal-specific recommendations")
+    print("• Surface preparation and process tips")
 
 
 if __name__ == "__main__":
@@ -6,17 +6,42 @@ This script demonstrates practical usage of the STLTools class
 for common real-world scenarios.
 """
 
-from api.stl import STLTools
+from api.core.stl_tools import STLTools
 import os
-import json
+from concurrent.futures import ProcessPoolExecutor
 
-def example_basic_analysis():
+import numpy as np
+import orjson
+
+# Example report written by example_export_report
+_REPORT_TEMPLATE = {
+    'file_info': {
+        'filename': 'complex_part.stl',
+        'analysis_date': '2024-01-15'
+    },
+    'mesh_properties': {
+        'surface_area': 150.25,
+        'volume': 125.50,
+        'triangle_count': 1024,
+        'vertex_count': 3072
+    },
+    'quality_metrics': {
+        'aspect_ratio': 2.5,
+        'surface_area_to_volume_ratio': 1.2,
+        'is_valid': True
+    },
+    'recommendations': [
+        'Mesh is suitable for 3D printing',
+        'Consider reducing triangle count for faster processing',
+        'Part has good surface area to volume ratio'
+    ]
+}
+_REPORT_BYTES = orjson.dumps(_REPORT_TEMPLATE, option=orjson.OPT_INDENT_2)
+
+def example_basic_analysis(stl_tools: STLTools):
     """Example: Basic mesh analysis."""
     print("=== Example 1: Basic Mesh Analysis ===")
     
-    # Initialize tools
-    stl_tools = STLTools()
-    
     # This would be your actual STL file
     # stl_tools.load_file("your_model.stl")
     
@@ -30,6 +55,15 @@ def example_basic_analysis():
     print("Triangle Count: 1,024")
     print("Center of Mass: [10.5, 15.2, 8.7]")
 
+def _analyze(filepath: str):
+    """Load and analyze a single STL file; runs in a worker process."""
+    stl_tools = STLTools()
+    try:
+        stl_tools.load_file(filepath)
+        return filepath, stl_tools.get_mesh_statistics(), None
+    except Exception as e:
+        return filepath, None, str(e)
+
 def example_batch_processing():
     """Example: Process multiple STL files in a directory."""
     print("\n=== Example 2: Batch Processing ===")
@@ -41,47 +75,45 @@ def example_batch_processing():
         print(f"Directory {stl_directory} not found. Creating example...")
         return
     
-    stl_tools = STLTools()
     results = {}
-    
-    # Process all STL files
-    for filename in os.listdir(stl_directory):
-        if filename.lower().endswith('.stl'):
-            filepath = os.path.join(stl_directory, filename)
+    # DirEntry carries the name, path and file type, saving a stat per entry
+    with os.scandir(stl_directory) as entries:
+        paths = [entry.path for entry in entries
+                 if entry.is_file(follow_symlinks=False) and entry.name.lower().endswith('.stl')]
+    
+    # Files are independent, so analyze them in parallel across CPU cores
+    with ProcessPoolExecutor() as executor:
+        for filepath, stats, error in executor.map(_analyze, paths):
+            filename = os.path.basename(filepath)
             print(f"Processing {filename}...")
             
-            try:
-                stl_tools.load_file(filepath)
-                stats = stl_tools.get_mesh_statistics()
-                
-                results[filename] = {
-                    'surface_area': stats['surface_area'],
-                    'volume': stats['volume'],
-                    'triangle_count': stats['triangle_count'],
-                    'aspect_ratio': stats['aspect_ratio'],
-                    'center_of_mass': stats['center_of_mass']
-                }
-                
-                print(f"  ✓ Surface Area: {stats['surface_area']:.2f}")
-                print(f"  ✓ Volume: {stats['volume']:.2f}")
-                print(f"  ✓ Triangles: {stats['triangle_count']:,}")
-                
-            except Exception as e:
-                print(f"  ✗ Error: {e}")
-                results[filename] = {'error': str(e)}
-    
-    # Save results to JSON
-    with open('batch_analysis_results.json', 'w') as f:
-        json.dump(results, f, indent=2)
+            if error is not None:
+                print(f"  ✗ Error: {error}")
+                results[filename] = {'error': error}
+                continue
+            
+            results[filename] = {
+                'surface_area': stats['surface_area'],
+                'volume': stats['volume'],
+                'triangle_count': stats['triangle_count'],
+                'aspect_ratio': stats['aspect_ratio'],
+                'center_of_mass': stats['center_of_mass']
+            }
+            
+            print(f"  ✓ Surface Area: {stats['surface_area']:.2f}")
+            print(f"  ✓ Volume: {stats['volume']:.2f}")
+            print(f"  ✓ Triangles: {stats['triangle_count']:,}")
+    
+    # Save results to JSON (stats may hold NumPy scalars)
+    with open('batch_analysis_results.json', 'wb') as f:
+        f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
     
     print(f"\nResults saved to batch_analysis_results.json")
 
-def example_quality_assurance():
+def example_quality_assurance(stl_tools: STLTools):
     """Example: Quality assurance workflow."""
     print("\n=== Example 3: Quality Assurance ===")
     
-    stl_tools = STLTools()
-    
     # This would be your production STL file
     # stl_tools.load_file("production_part.stl")
     
@@ -110,12 +142,10 @@ def example_quality_assurance():
     for warning in validation_results['warnings']:
         print(f"⚠ {warning}")
 
-def example_mesh_preparation():
+def example_mesh_preparation(stl_tools: STLTools):
     """Example: Prepare mesh for 3D printing."""
     print("\n=== Example 4: Mesh Preparation for 3D Printing ===")
     
-    stl_tools = STLTools()
-    
     # Load the mesh
     # stl_tools.load_file("original_part.stl")
     
@@ -143,27 +173,14 @@ def example_mesh_preparation():
     
     print("✓ Mesh prepared successfully!")
 
-def example_cost_estimation():
+def example_cost_estimation(stl_tools: STLTools):
     """Example: Estimate material cost based on volume."""
     print("\n=== Example 5: Material Cost Estimation ===")
     
-    stl_tools = STLTools()
-    
-    # Material densities (g/cm³)
-    materials = {
-        'PLA': 1.24,
-        'ABS': 1.04,
-        'PETG': 1.27,
-        'TPU': 1.21
-    }
-    
-    # Material costs ($/kg)
-    costs = {
-        'PLA': 20.0,
-        'ABS': 25.0,
-        'PETG': 30.0,
-        'TPU': 45.0
-    }
+    # Material properties as parallel arrays
+    names = ['PLA', 'ABS', 'PETG', 'TPU']
+    densities = np.array([1.24, 1.04, 1.27, 1.21])  # g/cm³
+    prices = np.array([20.0, 25.0, 30.0, 45.0])  # $/kg
     
     # Load mesh
     # stl_tools.load_file("part.stl")
@@ -177,19 +194,17 @@ def example_cost_estimation():
     print(f"Part volume: {volume_cm3:.2f} cm³")
     print("\nMaterial estimates:")
     
-    for material, density in materials.items():
-        weight_g = volume_cm3 * density
-        weight_kg = weight_g / 1000
-        cost = weight_kg * costs[material]
-        
+    weights_g = volume_cm3 * densities
+    weights_kg = weights_g * 1e-3
+    costs = weights_kg * prices
+    
+    for material, weight_g, weight_kg, cost in zip(names, weights_g, weights_kg, costs):
         print(f"{material:>6}: {weight_g:>6.1f}g ({weight_kg:>5.3f}kg) - ${cost:>6.2f}")
 
-def example_export_report():
+def example_export_report(stl_tools: STLTools):
     """Example: Generate a comprehensive report."""
     print("\n=== Example 6: Generate Comprehensive Report ===")
     
-    stl_tools = STLTools()
-    
     # Load mesh
     # stl_tools.load_file("complex_part.stl")
     
@@ -199,33 +214,10 @@ def example_export_report():
     # stats = stl_tools.get_mesh_statistics()
     # validation = stl_tools.validate_mesh()
     
-    # Create report
-    report = {
-        'file_info': {
-            'filename': 'complex_part.stl',
-            'analysis_date': '2024-01-15'
-        },
-        'mesh_properties': {
-            'surface_area': 150.25,
-            'volume': 125.50,
-            'triangle_count': 1024,
-            'vertex_count': 3072
-        },
-        'quality_metrics': {
-            'aspect_ratio': 2.5,
-            'surface_area_to_volume_ratio': 1.2,
-            'is_valid': True
-        },
-        'recommendations': [
-            'Mesh is suitable for 3D printing',
-            'Consider reducing triangle count for faster processing',
-            'Part has good surface area to volume ratio'
-        ]
-    }
-    
-    # Save report
-    with open('mesh_analysis_report.json', 'w') as f:
-        json.dump(report, f, indent=2)
+    # The report is static until it is built from real statistics, so its
+    # JSON was encoded once at import; switch back to orjson.dumps(report) then
+    with open('mesh_analysis_report.json', 'wb') as f:
+        f.write(_REPORT_BYTES)
     
     print("✓ Report generated: mesh_analysis_report.json")
 
@@ -234,18 +226,21 @@ def main():
     print("STL Tools - Practical Examples")
     print("==============================")
     
-    example_basic_analysis()
+    # One instance is shared by every example
+    stl_tools = STLTools()
+    
+    example_basic_analysis(stl_tools)
     example_batch_processing()
-    example_quality_assurance()
-    example_mesh_preparation()
-    example_cost_estimation()
-    example_export_report()
+    example_quality_assurance(stl_tools)
+    example_mesh_preparation(stl_tools)
+    example_cost_estimation(stl_tools)
+    example_export_report(stl_tools)
     
     print("\n=== Examples Completed ===")
     print("\nTo run these examples with real STL files:")
     print("1. Place your STL files in a directory")
     print("2. Update the file paths in the examples")
-    print("3. Run: python example_usage.py")
+    print("3. Run: python -m examples.example_usage")
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -34,7 +34,7 @@ setup(
     extras_require={
         "dev": [
             "pytest>=6.0",
-            "pytest-asyncio>=0.18.0",
+            "pytest-asyncio>=0.24.0",
             "black>=21.0",
             "flake8>=3.8",
             "mypy>=0.800",
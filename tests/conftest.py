@@ -0,0 +1,98 @@
+"""
+Shared fixtures for the STL tools tests.
+
+The test cube is serialized to an in-memory STL and parsed once per session;
+tests that only read from the mesh share a single loaded STLTools instance.
+"""
+
+import contextlib
+import io
+import sys
+import tempfile
+
+import pytest
+import stl
+from stl import mesh
+
+from api.core.stl_tools import STLTools
+from tests.mesh_factories import create_test_cube
+
+
+# Markers whose tests are skipped unless the matching --run<marker> option is given
+_OPT_IN_MARKERS = {
+    "slow": "slow running tests",
+    "perf": "pytest-benchmark timing tests",
+}
+
+
+def pytest_addoption(parser):
+    for name, description in _OPT_IN_MARKERS.items():
+        parser.addoption(f"--run{name}", action="store_true", help=f"run {description}")
+
+
+def pytest_configure(config):
+    for name, description in _OPT_IN_MARKERS.items():
+        config.addinivalue_line("markers", f"{name}: {description}, skipped unless --run{name} is given")
+
+
+def pytest_collection_modifyitems(config, items):
+    for name in _OPT_IN_MARKERS:
+        if config.getoption(f"--run{name}"):
+            continue
+        skip = pytest.mark.skip(reason=f"needs --run{name} to run")
+        for item in items:
+            if item.get_closest_marker(name):
+                item.add_marker(skip)
+
+
+class _Reporter:
+    """Collects a test's report lines and writes them to stdout in one call."""
+
+    def __init__(self):
+        self._out = io.StringIO()
+
+    def line(self, text: str = "") -> None:
+        self._out.write(text)
+        self._out.write("\n")
+
+    def flush(self) -> None:
+        sys.stdout.write(self._out.getvalue())
+        self._out = io.StringIO()
+
+
+def _stl_source():
+    """Serialize the test cube to a binary STL held in memory."""
+    buffer = io.BytesIO()
+    create_test_cube().save('cube.stl', fh=buffer, mode=stl.Mode.BINARY)
+    buffer.seek(0)
+    return buffer
+
+
+@contextlib.contextmanager
+def loaded_cube():
+    """Yield a fresh STLTools with the test cube loaded."""
+    tools = STLTools()
+    tools.load_mesh(mesh.Mesh.from_file('cube.stl', fh=_stl_source()))
+    yield tools
+
+
+@pytest.fixture(scope="session")
+def stl_tools():
+    """One STLTools with the test cube loaded; tests that mutate it must copy it first."""
+    with loaded_cube() as tools:
+        yield tools
+
+
+@pytest.fixture
+def report():
+    """Buffered replacement for print(), written out when the test finishes."""
+    reporter = _Reporter()
+    yield reporter
+    reporter.flush()
+
+
+@pytest.fixture(scope="session")
+def scratch():
+    """One temporary directory for every file the tests write, removed at session end."""
+    with tempfile.TemporaryDirectory() as path:
+        yield path
@@ -0,0 +1,95 @@
+"""
+Synthetic meshes for the STL tools tests and benchmarks.
+"""
+
+import numpy as np
+from stl import mesh
+
+
+def _allocate_mesh(n_triangles: int) -> mesh.Mesh:
+    """
+    Allocate a mesh without zero-filling it; the caller overwrites every vector.
+
+    Normals are left for numpy-stl to compute on save, and only the small
+    attribute field is cleared so saved files stay deterministic.
+    """
+    allocated = mesh.Mesh(np.empty(n_triangles, dtype=mesh.Mesh.dtype), calculate_normals=False)
+    allocated.attr[:] = 0
+    return allocated
+
+
+def create_test_cube():
+    """Create a simple unit cube mesh."""
+    # Create a simple cube
+    vertices = np.array([
+        [0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0],  # bottom face
+        [0, 0, 1], [1, 0, 1], [1, 1, 1], [0, 1, 1]   # top face
+    ], dtype=np.float32)
+
+    # Define the 12 triangles of the cube
+    faces = np.array([
+        [0, 3, 1], [1, 3, 2],  # bottom face
+        [0, 4, 7], [0, 7, 3],  # left face
+        [1, 2, 6], [1, 6, 5],  # right face
+        [2, 3, 7], [2, 7, 6],  # front face
+        [0, 1, 5], [0, 5, 4],  # back face
+        [4, 5, 6], [4, 6, 7]   # top face
+    ])
+
+    # Create the mesh
+    cube = _allocate_mesh(faces.shape[0])
+    # Gather straight into the mesh buffer; dtype must match its float32 vectors
+    np.take(vertices, faces, axis=0, out=cube.vectors)
+
+    return cube
+
+
+def make_cube_grid(copies: int) -> mesh.Mesh:
+    """Tile the test cube ``copies`` times along X, giving 12 * copies triangles."""
+    vectors = create_test_cube().vectors
+    offsets = np.zeros((copies, 1, 1, 3), dtype=np.float32)
+    offsets[:, 0, 0, 0] = 2.0 * np.arange(copies)
+    grid = _allocate_mesh(12 * copies)
+    grid.vectors[:] = (vectors + offsets).reshape(-1, 3, 3)
+    return grid
+
+
+def make_sphere_mesh(n_subdivisions: int) -> mesh.Mesh:
+    """Build a unit icosphere with 20 * 4**n_subdivisions triangles."""
+    t = (1.0 + 5.0 ** 0.5) / 2.0
+    vertices = np.array([
+        [-1, t, 0], [1, t, 0], [-1, -t, 0], [1, -t, 0],
+        [0, -1, t], [0, 1, t], [0, -1, -t], [0, 1, -t],
+        [t, 0, -1], [t, 0, 1], [-t, 0, -1], [-t, 0, 1]
+    ])
+    vertices /= np.linalg.norm(vertices, axis=1, keepdims=True)
+
+    # Icosahedron faces, wound counter-clockwise seen from outside
+    faces = np.array([
+        [0, 11, 5], [0, 5, 1], [0, 1, 7], [0, 7, 10], [0, 10, 11],
+        [1, 5, 9], [5, 11, 4], [11, 10, 2], [10, 7, 6], [7, 1, 8],
+        [3, 9, 4], [3, 4, 2], [3, 2, 6], [3, 6, 8], [3, 8, 9],
+        [4, 9, 5], [2, 4, 11], [6, 2, 10], [8, 6, 7], [9, 8, 1]
+    ])
+
+    for _ in range(n_subdivisions):
+        # Each edge is shared by two faces, so number the distinct edges once
+        edges = np.sort(faces[:, [0, 1, 1, 2, 2, 0]].reshape(-1, 2), axis=1)
+        unique_edges, inverse = np.unique(edges, axis=0, return_inverse=True)
+        midpoints = vertices[unique_edges].mean(axis=1)
+        midpoints /= np.linalg.norm(midpoints, axis=1, keepdims=True)
+
+        # Split every triangle into four using its edge midpoints ab, bc and ca
+        ab, bc, ca = (len(vertices) + inverse.reshape(-1, 3)).T
+        a, b, c = faces.T
+        vertices = np.vstack([vertices, midpoints])
+        faces = np.concatenate([
+            np.stack([a, ab, ca], axis=1),
+            np.stack([b, bc, ab], axis=1),
+            np.stack([c, ca, bc], axis=1),
+            np.stack([ab, bc, ca], axis=1)
+        ])
+
+    sphere = _allocate_mesh(len(faces))
+    sphere.vectors[:] = vertices[faces]
+    return sphere
@@ -4,7 +4,6 @@ Test script to verify copper electroplating calculations with 0.1 A/in² current
 """
 
 import sys
-import os
 
 from api.core.stl_tools import STLTools
 
@@ -3,11 +3,14 @@
 Simple test script for electroplating calculations
 """
 
+import copy
+import pickle
 import sys
-import os
+from dataclasses import fields
 
 # Import only the STLTools class
-from api.core.stl_tools import STLTools
+from api.core.stl_tools import STLTools, PlatingContext, PlatingResult
+from api.core.metals import METALS, Metal
 
 def test_electroplating_calculations():
     """Test the electroplating calculation functionality."""
@@ -43,36 +46,20 @@ def test_electroplating_calculations():
         
         # Test metal properties
         print("\n2. Testing metal properties...")
-        metals = ['nickel', 'copper', 'chrome', 'gold', 'silver']
+        metals = list(Metal)
         
         for metal in metals:
             try:
                 # Test the metal properties lookup
-                if metal == 'nickel':
-                    density = 8.9
-                    current_range = (0.07, 0.1)
-                    voltage = 6.0
-                elif metal == 'copper':
-                    density = 8.9
-                    current_range = (0.07, 0.1)
-                    voltage = 3.0
-                elif metal == 'chrome':
-                    density = 7.19
-                    current_range = (0.1, 0.15)
-                    voltage = 12.0
-                elif metal == 'gold':
-                    density = 19.32
-                    current_range = (0.02, 0.05)
-                    voltage = 3.0
-                elif metal == 'silver':
-                    density = 10.49
-                    current_range = (0.03, 0.06)
-                    voltage = 2.0
+                row = METALS[metal]
+                density = row['density']
+                current_range = (row['cd_min'], row['cd_max'])
+                voltage = row['voltage']
                 
-                print(f"   {metal.capitalize()}: density={density} g/cm³, current={current_range[0]}-{current_range[1]} A/in², voltage={voltage}V")
+                print(f"   {metal.name.capitalize()}: density={density} g/cm³, current={current_range[0]}-{current_range[1]} A/in², voltage={voltage}V")
                 
             except Exception as e:
-                print(f"   Error with {metal}: {e}")
+                print(f"   Error with {metal.key}: {e}")
         
         # Test calculation formulas
         print("\n3. Testing calculation formulas...")
@@ -167,6 +154,20 @@ def test_coverage_efficiency():
     
     return True
 
+def test_plating_dataclasses_copy_and_pickle():
+    """Frozen, slotted plating results must survive deepcopy and pickle."""
+    print("\nTesting PlatingResult/PlatingContext copy and pickle...")
+    
+    result = PlatingResult(*(float(i) for i in range(len(fields(PlatingResult)))))
+    context = PlatingContext(5000.0, 7.75, 0.775, 0.1, 8.96, 0.95, 3.0)
+    
+    for original in (result, context):
+        for clone in (copy.deepcopy(original), pickle.loads(pickle.dumps(original))):
+            assert clone == original
+            assert clone is not original
+    
+    print("✅ Copy and pickle round trips completed!")
+
 def main():
     """Run all tests."""
     print("Electroplating Calculation Tests")
@@ -181,6 +182,12 @@ def main():
     if not test_coverage_efficiency():
         success = False
     
+    try:
+        test_plating_dataclasses_copy_and_pickle()
+    except Exception as e:
+        print(f"❌ Error testing copy and pickle: {e}")
+        success = False
+    
     print("\n" + "=" * 50)
     if success:
         print("🎉 All tests passed! The electroplating calculations are working correctly.")
@@ -0,0 +1,56 @@
+"""
+Benchmarks for the STLTools entry points exercised by the test suite.
+
+Requires pytest-benchmark. The module is marked ``perf`` and is skipped
+unless ``--runperf`` is given. CI runs the benchmarks but does not gate on
+them yet; no baseline is committed. Save one locally and compare against it
+with:
+
+    pytest tests/test_stl_benchmarks.py --runperf --benchmark-autosave
+    pytest tests/test_stl_benchmarks.py --runperf --benchmark-compare
+"""
+
+import pytest
+
+from api.core.stl_tools import STLTools
+from tests.mesh_factories import make_cube_grid
+
+pytestmark = pytest.mark.perf
+
+
+# 12, 12 000 and 120 000 triangles
+@pytest.fixture(scope="module", params=[1, 1_000, 10_000], ids=lambda n: f"{12 * n}tri")
+def grid_tools(request):
+    tools = STLTools()
+    tools.load_mesh(make_cube_grid(request.param))
+    return tools
+
+
+def _bench(benchmark, tools, method):
+    # Reloading the mesh drops the cached results, so every round does the full work.
+    # pedantic() treats a non-None setup return value as (args, kwargs), so return nothing.
+    def _reload():
+        tools.load_mesh(tools.mesh)
+
+    return benchmark.pedantic(method, setup=_reload, rounds=20)
+
+
+def test_surface_area(benchmark, grid_tools):
+    _bench(benchmark, grid_tools, grid_tools.calculate_surface_area)
+
+
+def test_volume(benchmark, grid_tools):
+    _bench(benchmark, grid_tools, grid_tools.calculate_volume)
+
+
+def test_mesh_statistics(benchmark, grid_tools):
+    _bench(benchmark, grid_tools, grid_tools.get_mesh_statistics)
+
+
+def test_validate_mesh(benchmark, grid_tools):
+    _bench(benchmark, grid_tools, grid_tools.validate_mesh)
+
+
+def test_convex_hull_volume(benchmark, grid_tools):
+    pytest.importorskip("scipy")
+    _bench(benchmark, grid_tools, grid_tools.get_convex_hull_volume)
@@ -1,276 +1,199 @@
-#!/usr/bin/env python3
 """
-Test script for STL Tools
+Tests for STL Tools
 
-This script demonstrates the various features of the STLTools class.
-It creates a simple test cube and shows how to use the different methods.
+Exercises the various features of the STLTools class against a simple test
+cube provided by the fixtures in conftest.py. Run with ``pytest -n auto`` to
+spread the tests across cores. The larger sphere meshes are marked slow and
+only run with ``--runslow``.
 """
 
+import copy
+import json
+import math
 import numpy as np
-from stl import mesh
+import pytest
+from api.core import _plating_kernel
+from api.core.metals import Metal
 from api.core.stl_tools import STLTools
-import tempfile
+from tests.mesh_factories import make_sphere_mesh
 import os
+import sys
 
-def create_test_cube():
-    """Create a simple test cube STL file."""
-    # Create a simple cube
-    vertices = np.array([
-        [0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0],  # bottom face
-        [0, 0, 1], [1, 0, 1], [1, 1, 1], [0, 1, 1]   # top face
-    ])
-    
-    # Define the 12 triangles of the cube
-    faces = np.array([
-        [0, 3, 1], [1, 3, 2],  # bottom face
-        [0, 4, 7], [0, 7, 3],  # left face
-        [1, 2, 6], [1, 6, 5],  # right face
-        [2, 3, 7], [2, 7, 6],  # front face
-        [0, 1, 5], [0, 5, 4],  # back face
-        [4, 5, 6], [4, 6, 7]   # top face
-    ])
-    
-    # Create the mesh
-    cube = mesh.Mesh(np.zeros(faces.shape[0], dtype=mesh.Mesh.dtype))
-    for i, face in enumerate(faces):
-        for j in range(3):
-            cube.vectors[i][j] = vertices[face[j]]
-    
-    return cube
+def test_basic_functionality(stl_tools):
+    """Test basic STL tools functionality against the unit cube's known values."""
+    # One statistics pass covers all of the basic calculations
+    stats = stl_tools.get_mesh_statistics()
 
-def test_basic_functionality():
-    """Test basic STL tools functionality."""
-    print("=== Testing Basic Functionality ===")
-    
-    # Create a test cube
-    cube = create_test_cube()
-    
-    # Save it to a temporary file
-    with tempfile.NamedTemporaryFile(suffix='.stl', delete=False) as tmp_file:
-        cube.save(tmp_file.name)
-        tmp_filename = tmp_file.name
-    
-    try:
-        # Initialize STL tools
-        stl_tools = STLTools()
-        
-        # Load the file
-        print(f"Loading test cube from {tmp_filename}")
-        stl_tools.load_file(tmp_filename)
-        
-        # Test basic calculations
-        surface_area = stl_tools.calculate_surface_area()
-        volume = stl_tools.calculate_volume()
-        center = stl_tools.get_center_of_mass()
-        bounds = stl_tools.get_bounding_box()
-        
-        print(f"Surface Area: {surface_area:.6f}")
-        print(f"Volume: {volume:.6f}")
-        print(f"Center of Mass: {center}")
-        print(f"Bounding Box: {bounds}")
-        
-        # Test mesh statistics
-        stats = stl_tools.get_mesh_statistics()
-        print(f"Triangle Count: {stats['triangle_count']}")
-        print(f"Vertex Count: {stats['vertex_count']}")
-        print(f"Aspect Ratio: {stats['aspect_ratio']:.3f}")
-        print(f"SA/V Ratio: {stats['surface_area_to_volume_ratio']:.3f}")
-        
-    finally:
-        # Clean up
-        os.unlink(tmp_filename)
+    assert math.isclose(stats['surface_area'], 6.0, rel_tol=1e-6)
+    assert math.isclose(stats['volume'], 1.0, rel_tol=1e-6)
+    np.testing.assert_allclose(stats['center_of_mass'], [0.5, 0.5, 0.5], rtol=1e-6)
+    np.testing.assert_allclose(stats['bounding_box']['min'], [0.0, 0.0, 0.0], atol=1e-6)
+    np.testing.assert_allclose(stats['bounding_box']['max'], [1.0, 1.0, 1.0], rtol=1e-6)
+    assert stats['triangle_count'] == 12
+    assert stats['vertex_count'] == 36
+    assert math.isclose(stats['aspect_ratio'], 1.0, rel_tol=1e-6)
+    assert math.isclose(stats['surface_area_to_volume_ratio'], 6.0, rel_tol=1e-6)
 
-def test_validation():
+def test_validation(stl_tools):
     """Test mesh validation functionality."""
-    print("\n=== Testing Mesh Validation ===")
-    
-    # Create a test cube
-    cube = create_test_cube()
-    
-    # Save it to a temporary file
-    with tempfile.NamedTemporaryFile(suffix='.stl', delete=False) as tmp_file:
-        cube.save(tmp_file.name)
-        tmp_filename = tmp_file.name
-    
-    try:
-        stl_tools = STLTools()
-        stl_tools.load_file(tmp_filename)
-        
-        # Test validation
-        validation = stl_tools.validate_mesh()
-        print(f"Mesh Valid: {validation['is_valid']}")
-        if validation['issues']:
-            print(f"Issues: {validation['issues']}")
-        if validation['warnings']:
-            print(f"Warnings: {validation['warnings']}")
-        
-    finally:
-        os.unlink(tmp_filename)
+    validation = stl_tools.validate_mesh()
+    assert validation['is_valid']
+    assert validation['issues'] == []
+    assert validation['warnings'] == []
 
-def test_manipulation():
+def test_manipulation(stl_tools, scratch):
     """Test mesh manipulation functionality."""
-    print("\n=== Testing Mesh Manipulation ===")
-    
-    # Create a test cube
-    cube = create_test_cube()
-    
-    # Save it to a temporary file
-    with tempfile.NamedTemporaryFile(suffix='.stl', delete=False) as tmp_file:
-        cube.save(tmp_file.name)
-        tmp_filename = tmp_file.name
-    
-    try:
-        stl_tools = STLTools()
-        stl_tools.load_file(tmp_filename)
-        
-        # Get original stats
-        original_stats = stl_tools.get_mesh_statistics()
-        print(f"Original Volume: {original_stats['volume']:.6f}")
-        print(f"Original Surface Area: {original_stats['surface_area']:.6f}")
-        
-        # Test scaling
-        print("\nScaling mesh by 2x...")
-        stl_tools.scale_mesh(2.0)
-        scaled_stats = stl_tools.get_mesh_statistics()
-        print(f"Scaled Volume: {scaled_stats['volume']:.6f}")
-        print(f"Scaled Surface Area: {scaled_stats['surface_area']:.6f}")
-        
-        # Test translation
-        print("\nTranslating mesh by [1, 1, 1]...")
-        stl_tools.translate_mesh([1, 1, 1])
-        translated_stats = stl_tools.get_mesh_statistics()
-        print(f"Translated Center: {translated_stats['center_of_mass']}")
-        
-        # Save modified mesh
-        with tempfile.NamedTemporaryFile(suffix='.stl', delete=False) as tmp_file2:
-            modified_filename = tmp_file2.name
-        
-        try:
-            stl_tools.save_mesh(modified_filename)
-            print(f"Modified mesh saved to {modified_filename}")
-            
-            # Verify the saved file
-            stl_tools2 = STLTools()
-            stl_tools2.load_file(modified_filename)
-            saved_stats = stl_tools2.get_mesh_statistics()
-            print(f"Saved mesh volume: {saved_stats['volume']:.6f}")
-            
-        finally:
-            os.unlink(modified_filename)
-        
-    finally:
-        os.unlink(tmp_filename)
+    # Work on a copy so scaling and translation don't leak into other tests
+    stl_tools = copy.deepcopy(stl_tools)
+
+    # Scaling by 2 multiplies area by 4 and volume by 8
+    stl_tools.scale_mesh(2.0)
+    scaled_stats = stl_tools.get_mesh_statistics()
+    assert math.isclose(scaled_stats['volume'], 8.0, rel_tol=1e-6)
+    assert math.isclose(scaled_stats['surface_area'], 24.0, rel_tol=1e-6)
+    np.testing.assert_allclose(scaled_stats['center_of_mass'], [1.0, 1.0, 1.0], rtol=1e-6)
+
+    # Translation moves the center without changing the shape
+    stl_tools.translate_mesh([1, 1, 1])
+    translated_stats = stl_tools.get_mesh_statistics()
+    np.testing.assert_allclose(translated_stats['center_of_mass'], [2.0, 2.0, 2.0], rtol=1e-6)
+    assert math.isclose(translated_stats['volume'], 8.0, rel_tol=1e-6)
+
+    # Round-trip the modified mesh through a single file and check save/load parity
+    modified_filename = os.path.join(scratch, 'modified.stl')
+    assert stl_tools.save_mesh(modified_filename)
 
-def test_export():
+    stl_tools2 = STLTools()
+    stl_tools2.load_file(modified_filename)
+    saved_stats = stl_tools2.get_mesh_statistics()
+    for key in ('volume', 'surface_area', 'center_of_mass'):
+        np.testing.assert_allclose(saved_stats[key], translated_stats[key], rtol=1e-6)
+
+def test_export(stl_tools, scratch):
     """Test export functionality."""
-    print("\n=== Testing Export Functionality ===")
-    
-    # Create a test cube
-    cube = create_test_cube()
-    
-    # Save it to a temporary file
-    with tempfile.NamedTemporaryFile(suffix='.stl', delete=False) as tmp_file:
-        cube.save(tmp_file.name)
-        tmp_filename = tmp_file.name
-    
-    try:
-        stl_tools = STLTools()
-        stl_tools.load_file(tmp_filename)
-        
-        # Test JSON export
-        with tempfile.NamedTemporaryFile(suffix='.json', delete=False) as tmp_json:
-            json_filename = tmp_json.name
-        
-        try:
-            success = stl_tools.export_statistics(json_filename, 'json')
-            print(f"JSON export successful: {success}")
-            
-            # Read and display part of the exported JSON
-            with open(json_filename, 'r') as f:
-                content = f.read()
-                print(f"Exported JSON (first 200 chars): {content[:200]}...")
-                
-        finally:
-            os.unlink(json_filename)
-        
-        # Test text export
-        with tempfile.NamedTemporaryFile(suffix='.txt', delete=False) as tmp_txt:
-            txt_filename = tmp_txt.name
-        
-        try:
-            success = stl_tools.export_statistics(txt_filename, 'txt')
-            print(f"Text export successful: {success}")
-            
-            # Read and display the exported text
-            with open(txt_filename, 'r') as f:
-                content = f.read()
-                print("Exported text:")
-                print(content)
-                
-        finally:
-            os.unlink(txt_filename)
-        
-    finally:
-        os.unlink(tmp_filename)
+    # Test JSON export
+    json_filename = os.path.join(scratch, 'stats.json')
+    assert stl_tools.export_statistics(json_filename, 'json')
 
-def test_advanced_features():
+    with open(json_filename, 'r') as f:
+        exported = json.load(f)
+    assert exported['triangle_count'] == 12
+    assert exported['unique_vertex_count'] == 8
+    assert math.isclose(exported['surface_area'], 6.0, rel_tol=1e-6)
+    assert math.isclose(exported['volume'], 1.0, rel_tol=1e-6)
+
+    # Test text export
+    txt_filename = os.path.join(scratch, 'stats.txt')
+    assert stl_tools.export_statistics(txt_filename, 'txt')
+
+    with open(txt_filename, 'r') as f:
+        content = f.read()
+    assert "Triangle Count: 12\n" in content
+    assert "Surface Area: 6.000000\n" in content
+    assert "Volume: 1.000000\n" in content
+
+def test_advanced_features(stl_tools, report):
     """Test advanced features like convex hull."""
-    print("\n=== Testing Advanced Features ===")
-    
-    # Create a test cube
-    cube = create_test_cube()
-    
-    # Save it to a temporary file
-    with tempfile.NamedTemporaryFile(suffix='.stl', delete=False) as tmp_file:
-        cube.save(tmp_file.name)
-        tmp_filename = tmp_file.name
+    report.line("\n=== Testing Advanced Features ===")
     
-    try:
-        stl_tools = STLTools()
-        stl_tools.load_file(tmp_filename)
-        
-        # Test convex hull volume
-        hull_volume = stl_tools.get_convex_hull_volume()
-        if hull_volume is not None:
-            print(f"Convex Hull Volume: {hull_volume:.6f}")
-        else:
-            print("Convex hull calculation not available (scipy required)")
-        
-        # Test detailed statistics
-        stats = stl_tools.get_mesh_statistics()
-        print(f"Triangle Area Statistics:")
-        print(f"  Min: {stats['triangle_areas']['min']:.6f}")
-        print(f"  Max: {stats['triangle_areas']['max']:.6f}")
-        print(f"  Mean: {stats['triangle_areas']['mean']:.6f}")
-        print(f"  Std: {stats['triangle_areas']['std']:.6f}")
-        
-        print(f"Edge Length Statistics:")
-        print(f"  Min: {stats['edge_lengths']['min']:.6f}")
-        print(f"  Max: {stats['edge_lengths']['max']:.6f}")
-        print(f"  Mean: {stats['edge_lengths']['mean']:.6f}")
-        print(f"  Std: {stats['edge_lengths']['std']:.6f}")
-        
-    finally:
-        os.unlink(tmp_filename)
+    stats = stl_tools.get_mesh_statistics()
 
-def main():
-    """Run all tests."""
-    print("STL Tools Test Suite")
-    print("===================")
-    
-    try:
-        test_basic_functionality()
-        test_validation()
-        test_manipulation()
-        test_export()
-        test_advanced_features()
-        
-        print("\n=== All Tests Completed Successfully ===")
-        
-    except Exception as e:
-        print(f"\nTest failed with error: {e}")
-        import traceback
-        traceback.print_exc()
+    # The hull is built from the deduplicated vertices: 36 STL corners, 8 unique
+    unique_vertices, _ = stl_tools.get_indexed_vertices()
+    assert len(np.unique(stl_tools.mesh.vectors.reshape(-1, 3), axis=0)) == 8
+    assert len(unique_vertices) == 8
+
+    # The cube is convex, so its hull volume must match the mesh volume
+    hull_volume = stl_tools.get_convex_hull_volume()
+    if hull_volume is not None:
+        report.line(f"Convex Hull Volume: {hull_volume:.6f}")
+        assert math.isclose(hull_volume, stats['volume'], rel_tol=1e-6)
+        assert stl_tools.get_convex_hull_volume() == hull_volume
+    else:
+        report.line("Convex hull calculation not available (scipy required)")
+
+    # Test detailed statistics
+    report.line(f"Triangle Area Statistics:")
+    report.line(f"  Min: {stats['triangle_areas']['min']:.6f}")
+    report.line(f"  Max: {stats['triangle_areas']['max']:.6f}")
+    report.line(f"  Mean: {stats['triangle_areas']['mean']:.6f}")
+    report.line(f"  Std: {stats['triangle_areas']['std']:.6f}")
+
+    report.line(f"Edge Length Statistics:")
+    report.line(f"  Min: {stats['edge_lengths']['min']:.6f}")
+    report.line(f"  Max: {stats['edge_lengths']['max']:.6f}")
+    report.line(f"  Mean: {stats['edge_lengths']['mean']:.6f}")
+    report.line(f"  Std: {stats['edge_lengths']['std']:.6f}")
+
+@pytest.mark.parametrize("n", [
+    1,
+    3,
+    pytest.param(5, marks=pytest.mark.slow),
+    pytest.param(7, marks=pytest.mark.slow)
+])
+def test_sphere_scaling(n, report):
+    """Run the mesh analysis on icospheres from 80 up to 327 680 triangles."""
+    report.line(f"\n=== Testing Icosphere (subdivisions={n}) ===")
+
+    stl_tools = STLTools()
+    stl_tools.load_mesh(make_sphere_mesh(n))
+    stats = stl_tools.get_mesh_statistics()
+    validation = stl_tools.validate_mesh()
+
+    report.line(f"Triangle Count: {stats['triangle_count']}")
+    report.line(f"Surface Area: {stats['surface_area']:.6f}")
+    report.line(f"Volume: {stats['volume']:.6f}")
+
+    # An inscribed icosphere approaches the unit sphere from below
+    assert stats['triangle_count'] == 20 * 4 ** n
+    assert 0.85 < stats['surface_area'] / (4 * math.pi) < 1
+    assert 0.85 < stats['volume'] / (4 / 3 * math.pi) < 1
+    assert validation['is_valid']
+
+@pytest.mark.parametrize("backend", ["_plating_core_numpy", "_plating_core_numba", "_plating_core_cython"])
+@pytest.mark.parametrize("cd_min, cd_max", [(0.03, 0.05), (0.07, 0.1), (0.1, 0.3)])
+def test_plating_backends_agree(stl_tools, backend, cd_min, cd_max):
+    """Every plating kernel backend matches calculate_electroplating_parameters on each rate band."""
+    kernel = getattr(_plating_kernel, backend, None)
+    if kernel is None:
+        pytest.skip(f"{backend} is not available")
+
+    params = stl_tools.calculate_electroplating_parameters(
+        current_density_min=cd_min, current_density_max=cd_max, plating_thickness_microns=25.0,
+        metal_density_g_cm3=8.9, current_efficiency=0.9, voltage=6.0
+    )
+    expected = [
+        params['current_requirements']['recommended_amps'],
+        params['plating_parameters']['plating_time_minutes'],
+        # The reported mass includes the coverage adjustment; the kernel assumes full coverage
+        params['material_requirements']['metal_mass_g'] * params['quality_factors']['coverage_efficiency'],
+        params['power_requirements']['energy_wh'],
+        params['cost_estimates']['electricity_cost'],
+        params['cost_estimates']['solution_cost'],
+    ]
+
+    args = [np.array([x], dtype=np.float64)
+            for x in (params['surface_area']['mm2'], cd_min, cd_max, 25.0, 8.9, 0.9, 6.0)]
+    np.testing.assert_allclose(np.asarray(kernel(*args))[:, 0], expected, rtol=1e-9)
+
+def test_plating_context_matches_parameters(stl_tools):
+    """A prepared plating context gives the same figures as the full calculation."""
+    context = stl_tools.prepare_plating_context(metal=Metal.COPPER, current_density=0.085, voltage=3.0, efficiency=0.95)
+    params = stl_tools.calculate_electroplating_parameters(
+        current_density_min=0.085, current_density_max=0.085, plating_thickness_microns=80.0,
+        metal_density_g_cm3=8.96, current_efficiency=0.95, voltage=3.0
+    )
+
+    single = context.for_thickness(80.0)
+    assert math.isclose(single['plating_time_minutes'], params['plating_parameters']['plating_time_minutes'], rel_tol=1e-9)
+    assert math.isclose(single['energy_wh'], params['power_requirements']['energy_wh'], rel_tol=1e-9)
+    assert math.isclose(single['total_cost'], params['cost_estimates']['total_cost'], rel_tol=1e-9)
+
+    # An array of thicknesses keeps its shape and agrees with the scalar call
+    sweep = context.for_thickness(np.array([[40.0, 80.0]]))
+    assert sweep['metal_mass_g'].shape == (1, 2)
+    assert math.isclose(sweep['metal_mass_g'][0, 1], single['metal_mass_g'], rel_tol=1e-12)
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    # Standalone runs go through pytest so the fixtures apply; xdist spreads the tests over worker processes
+    sys.exit(pytest.main([__file__, "-n", "auto"]))